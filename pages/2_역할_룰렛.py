@@ -1,9 +1,11 @@
 import streamlit as st
-import random, time
+import time
 import pandas as pd
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from pathlib import Path
+from retro_core.roulette import DEFAULT_ROLES, parse_list, spin, parse_role_caps, parse_team_csv, batch_assign
+from retro_core.actions import allow, gate_for
+from retro_core.assets import ROULETTE_GIF, asset_bytes
 
 st.set_page_config(page_title="픽셀 레트로 역할 룰렛", page_icon="🎰")
 KST = ZoneInfo("Asia/Seoul")
@@ -20,48 +22,117 @@ h1,h2,h3{ font-family:'Press Start 2P', system-ui, -apple-system, Segoe UI, Robo
 st.title("🎰 픽셀 레트로 역할 룰렛")
 
 if "students" not in st.session_state: st.session_state.students = []
-if "roles" not in st.session_state: st.session_state.roles = ["팀장","서기","자료 조사","발표자","시간 관리","정리 담당"]
+if "roles" not in st.session_state: st.session_state.roles = list(DEFAULT_ROLES)
 if "assignments" not in st.session_state: st.session_state.assignments = []
+if "batch_assignments" not in st.session_state: st.session_state.batch_assignments = []
+if "reveal" not in st.session_state: st.session_state.reveal = None   # 연출 중인 배정 결과
 
 with st.expander("📝 학생 & 역할 목록 입력"):
     student_input = st.text_area("학생 목록 (쉼표/줄바꿈)", height=100)
-    role_input = st.text_area("역할 목록 (쉼표/줄바꿈)", value="팀장, 서기, 자료 조사, 발표자, 시간 관리, 정리 담당", height=80)
-    if st.button("목록 저장", type="primary"):
+    role_input = st.text_area("역할 목록 (쉼표/줄바꿈)", value=", ".join(DEFAULT_ROLES), height=80)
+    if st.button("목록 저장", type="primary") and allow(st.session_state, "save"):
         if student_input.strip():
-            st.session_state.students = [s.strip() for s in student_input.replace("\n",",").split(",") if s.strip()]
-            st.session_state.roles = [r.strip() for r in role_input.replace("\n",",").split(",") if r.strip()]
+            st.session_state.students = parse_list(student_input)
+            st.session_state.roles = parse_list(role_input)
             st.success(f"학생 {len(st.session_state.students)}명, 역할 {len(st.session_state.roles)}개 저장 완료!")
 
-col1, col2 = st.columns(2)
-with col1:
-    if st.button("🎯 룰렛 돌리기", use_container_width=True):
-        unassigned_students = [s for s in st.session_state.students if s not in [a["학생"] for a in st.session_state.assignments]]
-        unassigned_roles = [r for r in st.session_state.roles if r not in [a["역할"] for a in st.session_state.assignments]]
+SPIN_SEC = 2.5
 
-        if not unassigned_students:
-            st.warning("모든 학생이 배정되었습니다!")
-        elif not unassigned_roles:
-            st.warning("모든 역할이 배정되었습니다!")
+# 룰렛 결과 카드: 돌리기/초기화는 이 블록만 다시 실행 (입력 영역은 그대로)
+# 배정은 누르는 즉시 기록하고 연출은 그 뒤에 → 연출 중 다시 눌려도 배정은 한 번, 애니메이션은 남은 시간만 이어서
+@st.fragment
+def roulette_board():
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🎯 룰렛 돌리기", use_container_width=True) and allow(st.session_state, "spin"):
+            student, role = spin(st.session_state.students, st.session_state.roles, st.session_state.assignments)
+
+            if student is None:
+                st.warning("모든 학생이 배정되었습니다!")
+            elif role is None:
+                st.warning("모든 역할이 배정되었습니다!")
+            else:
+                st.session_state.assignments.append({"학생":student,"역할":role,"배정시각":datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")})
+                st.session_state.reveal = {"student": student, "role": role, "until": time.monotonic() + SPIN_SEC}
+                gate_for(st.session_state).hold("spin", SPIN_SEC)
+
+        rv = st.session_state.reveal
+        if rv:
+            wait = rv["until"] - time.monotonic()
+            if wait > 0:
+                ph = st.empty()
+                ph.image(asset_bytes(ROULETTE_GIF), use_container_width=True)
+                time.sleep(wait)
+                ph.empty()
+            st.markdown(f"<div class='retro-card'>🎉 <b>{rv['student']}</b> 님 → <b>{rv['role']}</b> 역할 확정!</div>", unsafe_allow_html=True)
+            st.session_state.reveal = None
+
+    with col2:
+        if st.button("🔄 초기화", use_container_width=True) and allow(st.session_state, "reset"):
+            st.session_state.assignments = []
+            st.session_state.reveal = None
+            st.success("배정 기록 초기화 완료!")
+
+    if st.session_state.assignments:
+        df = pd.DataFrame(st.session_state.assignments)
+        st.dataframe(df, use_container_width=True)
+        st.download_button("💾 배정 결과 (CSV)", df.to_csv(index=False).encode("utf-8-sig"), "assignments.csv", "text/csv")
+    suppressed = gate_for(st.session_state).total_suppressed
+    if suppressed: st.caption(f"중복 클릭 {suppressed}회 무시됨")
+
+roulette_board()
+
+# ============================ 여러 팀 일괄 배정 ============================
+with st.expander("👥 여러 팀 일괄 배정 (역할 정원)"):
+    src = st.radio("팀 명단", ["자리 배치 페이지의 조 편성", "CSV 업로드 (이름, 조)"], horizontal=True)
+    members = None
+    if src.startswith("자리"):
+        people = [p for p in st.session_state.get("people", []) if p.get("group")]
+        if people:
+            members = pd.DataFrame({"학생": [p["name"] for p in people], "팀": [p["group"] for p in people]})
         else:
-            ph = st.empty()
-            ph.image(str(Path(__file__).parent.parent / "assets" / "roulette_smooth.gif"), use_container_width=True)
-            time.sleep(2.5)
-            ph.empty()
-
-            student = random.choice(unassigned_students)
-            role = random.choice(unassigned_roles)
-            st.session_state.assignments.append({"학생":student,"역할":role,"배정시각":datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")})
-            st.markdown(f"<div class='retro-card'>🎉 <b>{student}</b> 님 → <b>{role}</b> 역할 확정!</div>", unsafe_allow_html=True)
-
-with col2:
-    if st.button("🔄 초기화", use_container_width=True):
-        st.session_state.assignments = []
-        st.success("배정 기록 초기화 완료!")
-
-if st.session_state.assignments:
-    df = pd.DataFrame(st.session_state.assignments)
-    st.dataframe(df, use_container_width=True)
-    st.download_button("💾 배정 결과 (CSV)", df.to_csv(index=False).encode("utf-8-sig"), "assignments.csv", "text/csv")
+            st.info("자리 배치 페이지에서 명단과 조 번호를 먼저 적용해 주세요.")
+    else:
+        team_file = st.file_uploader("팀 CSV", type=["csv"], key="team_csv")
+        if team_file is not None:
+            try: members = parse_team_csv(team_file)
+            except ValueError as e: st.warning(str(e))
+
+    caps_input = st.text_area("역할 정원 (역할:인원, 쉼표/줄바꿈)",
+                              value="팀장:1, 서기:1, 자료 조사:2, 발표자:1, 시간 관리:1, 정리 담당:1", height=80)
+    batch_seed = st.text_input("씨드(선택)", placeholder="예: 2025-프로젝트주간", key="batch_seed")
+    reveal = st.checkbox("팀별 공개 애니메이션", value=False)
+
+    if st.button("🎲 전체 팀 배정", type="primary", disabled=members is None or members.empty) and allow(st.session_state, "batch"):
+        role_caps = parse_role_caps(caps_input)
+        if not role_caps:
+            st.warning("역할 정원을 입력해 주세요.")
+        else:
+            result = batch_assign(members, role_caps, batch_seed if batch_seed else None)
+            st.session_state.batch_assignments = result.to_dict("records")
+            sizes = members.groupby("팀").size()
+            short = int((sizes < sum(c for _, c in role_caps)).sum())
+            st.success(f"{sizes.size}개 팀, 학생 {len(result)}명 배정 완료!")
+            if short:
+                st.warning(f"인원이 역할 정원보다 적은 팀 {short}곳은 목록 뒤쪽 역할이 비어 있습니다.")
+
+            if reveal:
+                # 배정은 이미 기록됨 → 공개가 끝날 때까지 다시 눌린 클릭은 흡수 (재배정·연출 중복 방지)
+                gate_for(st.session_state).hold("batch", 1.0 + 0.4 * sizes.size)
+                ph = st.empty()
+                ph.image(asset_bytes(ROULETTE_GIF), use_container_width=True)
+                time.sleep(1.0)
+                ph.empty()
+                for team, g in result.groupby("팀", sort=False):
+                    lines = "<br>".join(f"<b>{r}</b> · {n}" for n, r in zip(g["학생"], g["역할"]))
+                    st.markdown(f"<div class='retro-card'>🎉 {team}팀<br>{lines}</div>", unsafe_allow_html=True)
+                    time.sleep(0.4)
+
+    if st.session_state.batch_assignments:
+        bdf = pd.DataFrame(st.session_state.batch_assignments)
+        st.dataframe(bdf, use_container_width=True)
+        st.download_button("💾 팀별 배정 결과 (CSV)", bdf.to_csv(index=False).encode("utf-8-sig"),
+                           "team_assignments.csv", "text/csv")
 
 # 푸터
 st.markdown("""
@@ -1,21 +1,16 @@
 # 레트로 발표 타이머 (수정된 버전)
 import time
-import os
 import streamlit as st
+import streamlit.components.v1 as components
+from retro_core import timer as agenda_core
+from retro_core.actions import guarded
+from retro_core.assets import SUCCESS_SOUND as SUCCESS_SOUND_NAME, asset_bytes, data_uri
 
 st.set_page_config(page_title="레트로 발표 타이머", page_icon="🕹️", layout="wide")
 
 # ==== Assets (optional) ====
-# assets 폴더가 실제 존재하지 않을 경우를 대비한 예외 처리
-try:
-    # __file__ 변수가 없는 환경(예: 일부 클라우드 노트북)을 위한 처리
-    base_path = os.path.dirname(__file__) if "__file__" in locals() else "."
-    ASSETS = os.path.join(base_path, "assets")
-    SUCCESS_SOUND = os.path.join(ASSETS, "success1.mp3")
-    if not os.path.exists(SUCCESS_SOUND):
-        SUCCESS_SOUND = None
-except Exception:
-    SUCCESS_SOUND = None
+# 효과음은 프로세스 캐시(retro_core.assets)에서 읽음 — 파일이 없으면 None
+SUCCESS_SOUND = asset_bytes(SUCCESS_SOUND_NAME)
 
 
 # ==== CSS ====
@@ -62,6 +57,7 @@ defaults = {
     "duration_sec": 0, "end_ts": None, "paused": False,
     "paused_remaining": 0, "running": False, "ended": False,
     "play_sound": True, "minutes": 3, "tick_ms": 200,
+    "mode": "단일 타이머", "agenda": None, "agenda_text": "", "gap_sec": 30,
 }
 for k, v in defaults.items():
     if k not in ss: ss[k] = v
@@ -70,7 +66,7 @@ for k, v in defaults.items():
 def remaining_secs() -> float:
     """남은 시간을 초 단위로 계산하여 반환합니다."""
     if ss.running and not ss.paused and ss.end_ts is not None:
-        return max(0.0, ss.end_ts - time.time())
+        return max(0.0, ss.end_ts - time.monotonic())
     if ss.paused:
         return max(0.0, ss.paused_remaining)
     if ss.ended:
@@ -93,6 +89,7 @@ def pick_bg(rem: float, total: float) -> str:
     return "var(--red)"
 
 # ==== Callbacks (버튼 클릭 시 실행될 함수) ====
+# 상태를 바꾸는 버튼(시작·일시정지·다음·리셋·프리셋·불러오기)은 guarded로 감싸 두 번 눌림을 한 번으로 처리합니다.
 def cb_preset(mins:int):
     """프리셋 버튼 클릭 시 분을 설정합니다."""
     ss.minutes = mins
@@ -103,7 +100,7 @@ def cb_preset(mins:int):
 def cb_start():
     """시작/재시작 버튼 클릭 시 타이머를 초기화하고 시작합니다."""
     ss.duration_sec = ss.minutes * 60
-    ss.end_ts = time.time() + ss.duration_sec
+    ss.end_ts = time.monotonic() + ss.duration_sec
     ss.running = True
     ss.paused = False
     ss.ended = False
@@ -116,7 +113,7 @@ def cb_toggle():
         ss.paused_remaining = remaining_secs()
         ss.paused = True
     else:
-        ss.end_ts = time.time() + ss.paused_remaining
+        ss.end_ts = time.monotonic() + ss.paused_remaining
         ss.paused = False
 
 def cb_reset():
@@ -128,9 +125,33 @@ def cb_reset():
     ss.duration_sec = ss.minutes * 60
     ss.paused_remaining = 0
 
+# ==== Agenda (발표 진행표) ====
+# 진행표는 서버에서 한 번만 계산하고, 카운트다운·자동 넘김·효과음은 브라우저(performance.now, 단조 시계)가 처리합니다.
+# 따라서 발표자 사이에는 재실행이 없고, 교사 버튼(시작/일시정지/다음/리셋)에서만 재실행됩니다.
+def cb_agenda_load():
+    """진행표 불러오기: 발표자 목록과 교대 시간으로 전체 일정을 미리 계산합니다."""
+    items = agenda_core.parse_agenda(ss.agenda_text, default_min=ss.minutes)
+    ss.agenda = agenda_core.build_agenda(items, ss.gap_sec) if items else None
+
+def cb_agenda_start():
+    if ss.agenda: agenda_core.start(ss.agenda)
+
+def cb_agenda_toggle():
+    if not ss.agenda or ss.agenda.started_at is None: return
+    if ss.agenda.paused_at is None: agenda_core.pause(ss.agenda)
+    else: agenda_core.resume(ss.agenda)
+
+def cb_agenda_skip():
+    if ss.agenda and ss.agenda.started_at is not None: agenda_core.skip(ss.agenda)
+
+def cb_agenda_reset():
+    if ss.agenda: agenda_core.reset(ss.agenda)
+
+
 # ==== Sidebar Controls (사이드바 UI) ====
 with st.sidebar:
     st.markdown("## 🕹️ 레트로 발표 타이머")
+    st.radio("모드", ["단일 타이머", "발표 진행표"], key="mode", horizontal=True)
     ss.minutes = st.number_input("발표 시간(분)", min_value=1, max_value=180, step=1, value=ss.minutes)
 
     ss.tick_ms = st.selectbox("갱신 주기", options=[100, 200, 500, 1000],
@@ -139,44 +160,59 @@ with st.sidebar:
 
     st.write("프리셋")
     c1, c2, c3 = st.columns(3)
-    c1.button("3분", on_click=cb_preset, args=(3,), use_container_width=True)
-    c2.button("5분", on_click=cb_preset, args=(5,), use_container_width=True)
-    c3.button("10분", on_click=cb_preset, args=(10,), use_container_width=True)
+    c1.button("3분", on_click=guarded(ss, "preset", cb_preset, token=3), args=(3,), use_container_width=True)
+    c2.button("5분", on_click=guarded(ss, "preset", cb_preset, token=5), args=(5,), use_container_width=True)
+    c3.button("10분", on_click=guarded(ss, "preset", cb_preset, token=10), args=(10,), use_container_width=True)
 
     st.divider()
-    st.button("▶ 시작/재시작", use_container_width=True, on_click=cb_start)
-    st.button("⏸ 일시정지/재개", use_container_width=True, on_click=cb_toggle)
-    st.button("⟲ 리셋", use_container_width=True, on_click=cb_reset)
+    if ss.mode == "발표 진행표":
+        ss.agenda_text = st.text_area("발표자 (한 줄에 '이름[, 분]')", value=ss.agenda_text, height=180,
+                                      help="분을 생략하면 위의 발표 시간을 씁니다.")
+        ss.gap_sec = st.number_input("교대 시간(초)", min_value=0, max_value=600, step=10, value=ss.gap_sec)
+        st.button("📋 진행표 불러오기", use_container_width=True, on_click=guarded(ss, "load", cb_agenda_load))
+        if ss.agenda:
+            st.caption(f"발표 {sum(seg['kind'] == agenda_core.TALK for seg in ss.agenda.segments)}명 · 총 {fmt(ss.agenda.total)}")
+        st.button("▶ 시작", use_container_width=True, on_click=guarded(ss, "start", cb_agenda_start))
+        st.button("⏸ 일시정지/재개", use_container_width=True, on_click=guarded(ss, "toggle", cb_agenda_toggle))
+        st.button("⏭ 다음", use_container_width=True, on_click=guarded(ss, "skip", cb_agenda_skip))
+        st.button("⟲ 리셋", use_container_width=True, on_click=guarded(ss, "reset", cb_agenda_reset))
+    else:
+        st.button("▶ 시작/재시작", use_container_width=True, on_click=guarded(ss, "start", cb_start))
+        st.button("⏸ 일시정지/재개", use_container_width=True, on_click=guarded(ss, "toggle", cb_toggle))
+        st.button("⟲ 리셋", use_container_width=True, on_click=guarded(ss, "reset", cb_reset))
 
     st.toggle("종료 효과음", value=ss.play_sound, key="play_sound_toggle", help="0초가 되면 효과음을 재생합니다.")
     ss.play_sound = ss.play_sound_toggle
 
-# ==== 상태 계산 및 업데이트 ====
-rem = remaining_secs()
-is_running_now = ss.running and not ss.paused
-
-# 타이머가 실행 중일 때 시간이 다 되면 상태 변경
-if is_running_now and rem <= 0:
-    ss.running = False
-    ss.ended = True
-    is_running_now = False # 현재 스크립트 실행 주기 내에서 상태를 즉시 반영
-    rem = 0
-
 # ==== Main Screen (메인 화면 렌더링) ====
-bg = pick_bg(rem, ss.duration_sec)
-if is_running_now:
-    status = "진행 중"
-elif ss.paused:
-    status = "일시정지"
-elif ss.ended:
-    status = "완료!"
-else:
-    status = "대기 중"
+# 실행 중에는 화면 블록만 tick_ms 주기로 다시 실행합니다. (사이드바·CSS는 재실행하지 않음)
+# 정지/일시정지 상태에서는 주기 실행을 끄고, 버튼 콜백의 전체 재실행 때 주기가 다시 정해집니다.
+@st.fragment(run_every=ss.tick_ms / 1000 if (ss.running and not ss.paused) else None)
+def timer_screen():
+    # ==== 상태 계산 및 업데이트 ====
+    rem = remaining_secs()
+    is_running_now = ss.running and not ss.paused
+
+    # 타이머가 실행 중일 때 시간이 다 되면 상태 변경 후 전체 재실행 → 주기 실행 해제
+    if is_running_now and rem <= 0:
+        ss.running = False
+        ss.ended = True
+        st.rerun()
+
+    bg = pick_bg(rem, ss.duration_sec)
+    if is_running_now:
+        status = "진행 중"
+    elif ss.paused:
+        status = "일시정지"
+    elif ss.ended:
+        status = "완료!"
+    else:
+        status = "대기 중"
 
-urgent_class = " urgent" if (is_running_now and rem <= 10) else ""
-time_text = fmt(rem)
+    urgent_class = " urgent" if (is_running_now and rem <= 10) else ""
+    time_text = fmt(rem)
 
-st.markdown(f"""
+    st.markdown(f"""
 <div class="crt-wrap">
   <div class="crt">
     <div class="screen" style="background:{bg};">
@@ -187,21 +223,22 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# ==== Sound (효과음 재생) ====
-# ss.ended 상태가 되고, ss.play_sound가 True일 때 한 번만 재생
-if ss.ended and ss.play_sound:
-    if SUCCESS_SOUND and os.path.exists(SUCCESS_SOUND):
-        with open(SUCCESS_SOUND, "rb") as f:
-            st.audio(f.read(), format="audio/mp3", start_time=0)
-    ss.play_sound = False # 소리가 반복 재생되지 않도록 플래그를 변경
+    # ==== Sound (효과음 재생) ====
+    # ss.ended 상태가 되고, ss.play_sound가 True일 때 한 번만 재생
+    if ss.ended and ss.play_sound:
+        if SUCCESS_SOUND:
+            st.audio(SUCCESS_SOUND, format="audio/mp3", start_time=0)
+        ss.play_sound = False # 소리가 반복 재생되지 않도록 플래그를 변경
+
+if ss.mode == "발표 진행표":
+    if ss.agenda:
+        sound = data_uri(SUCCESS_SOUND_NAME) if ss.play_sound and SUCCESS_SOUND else ""
+        components.html(agenda_core.agenda_html(ss.agenda, sound), height=720)
+    else:
+        st.info("사이드바에 발표자 목록을 입력하고 ‘📋 진행표 불러오기’를 누르세요.")
+else:
+    timer_screen()
 
 # ==== Footer (하단 푸터) ====
 st.markdown("<div id='retro-footer'>© © 2025 Lee Daehyoung. All rights reserved. • Press Start 2P & CRT Style</div>", unsafe_allow_html=True)
 
-
-# ==== 다음 업데이트 예약 (스크립트의 가장 마지막에 위치) ====
-# 타이머가 '실행 중' 상태일 때만 지정된 시간 후 재실행을 예약합니다.
-# 이 로직이 화면 렌더링 코드보다 뒤에 있어, UI가 먼저 갱신되고 다음 업데이트가 예약됩니다.
-if is_running_now:
-    time.sleep(ss.tick_ms / 1000)
-    st.rerun()
\ No newline at end of file
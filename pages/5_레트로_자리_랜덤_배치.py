@@ -1,10 +1,14 @@
 # pages/5_레트로_자리_랜덤_배치.py
-# 레트로 자리 랜덤 배치 (성별 색상 / 조 배지 / PNG 내보내기 / 씨드 설명)
-import random, itertools, io, re, os
-from typing import List, Dict, Optional
-import pandas as pd
-from PIL import Image, ImageDraw, ImageFont
+# 레트로 자리 랜덤 배치 (성별 색상 / 조 배지 / PNG·SVG·PDF 내보내기 / 씨드 설명)
 import streamlit as st
+from retro_core.seating import (empty_grid, resize_grid, parse_text_lines, parse_uploaded,
+                                shuffle_seats, reseat, swap, seats_to_dataframe, render_png)
+from retro_core.exam_hall import parse_rooms, parse_exam_students, allocate_exam_hall, exam_hall_zip
+from retro_core.seat_rules import RULES, RULE_LABELS, ConflictTracker, parse_apart
+from retro_core.vector_export import render_svg, render_pdf
+from retro_core.fonts import register_font, registered, default_font, font_data
+from retro_core.actions import allow, gate_for
+from retro_core.store import Store
 
 # 멀티페이지에서는 홈에서 set_page_config를 이미 호출했을 수 있으므로 예외 처리
 try:
@@ -45,6 +49,11 @@ section.main>div { padding: 20px 28px 110px 28px; } /* footer 여백 */
   background:linear-gradient(180deg, #1e293b, #0b1220);
 }
 .seat.locked { border-color:#f59e0b; filter:saturate(.7) brightness(.9); }
+.seat.conflict { box-shadow:0 0 0 3px #dc2626, 0 0 14px rgba(220,38,38,.7); }
+.seat .warn{
+  position:absolute; bottom:6px; right:8px; font-size:10px; padding:1px 6px;
+  border-radius:10px; background:#dc2626; color:#fff;
+}
 .seat .nick{
   font-family:'Press Start 2P', monospace; font-size:11px; line-height:1.3;
   word-break:keep-all; color:#e2e8f0; text-shadow:0 0 6px rgba(0,0,0,.6);
@@ -88,143 +97,25 @@ def init_state():
     ss = st.session_state
     if "rows" not in ss: ss.rows = 4            # 행(가로 줄 수)
     if "cols" not in ss: ss.cols = 4            # 열(세로 자리 수)
-    if "seats" not in ss: ss.seats = [[None for _ in range(ss.cols)] for __ in range(ss.rows)]
-    if "locked" not in ss: ss.locked = [[False for _ in range(ss.cols)] for __ in range(ss.rows)]
+    if "seats" not in ss: ss.seats = empty_grid(ss.rows, ss.cols)
+    if "locked" not in ss: ss.locked = empty_grid(ss.rows, ss.cols, False)
     if "selecting" not in ss: ss.selecting = None
     if "people" not in ss: ss.people = []       # list of dicts: {name, gender, group}
+    if "conflicts" not in ss: ss.conflicts = None   # ConflictTracker (None = 다시 계산 필요)
 init_state()
 
-def resize_grid(r, c):
-    old_r, old_c = len(st.session_state.seats), len(st.session_state.seats[0])
-    new_seats = [[None for _ in range(c)] for __ in range(r)]
-    new_lock  = [[False for _ in range(c)] for __ in range(r)]
-    for i in range(min(r, old_r)):
-        for j in range(min(c, old_c)):
-            new_seats[i][j] = st.session_state.seats[i][j]
-            new_lock[i][j]  = st.session_state.locked[i][j]
-    st.session_state.seats, st.session_state.locked = new_seats, new_lock
-
-def normalize_gender(g: Optional[str]) -> Optional[str]:
-    if not g: return None
-    g = str(g).strip().lower()
-    if g in ["m", "male", "남", "남자", "boy"]: return "M"
-    if g in ["f", "female", "여", "여자", "girl"]: return "F"
-    return None
-
-def parse_text_lines(text: str) -> List[Dict]:
-    """이름[,성별][,조] / 괄호표기(홍길동(남) 2) 등 다양한 라인 파싱"""
-    people = []
-    for line in text.splitlines():
-        s = line.strip()
-        if not s: continue
-        name, gender, group = s, None, None
-        m = re.search(r"[([]\s*([mfMF남여男女])\s*[])]", s)
-        if m: gender = m.group(1)
-        m2 = re.search(r"(\d+)\s*$", s)
-        if m2: group = int(m2.group(1))
-        parts = [p.strip() for p in re.split(r"[,\t]", s)]
-        if len(parts) >= 1: name = parts[0] or name
-        if len(parts) >= 2: gender = parts[1] or gender
-        if len(parts) >= 3 and parts[2].isdigit(): group = int(parts[2])
-        people.append({"name": name, "gender": normalize_gender(gender), "group": group})
-    return people
-
-def parse_uploaded(file) -> List[Dict]:
-    """CSV: name[, gender][, group] (헤더 없어도 동작)"""
-    try:
-        df = pd.read_csv(file)
-    except Exception:
-        file.seek(0)
-        df = pd.read_csv(file, header=None)
-        if df.shape[1] == 1:
-            df.columns = ["name"]
-    cols = [c.lower() for c in df.columns]
-    col_map = {}
-    for key in ["name", "gender", "group"]:
-        if key in cols: col_map[key] = df.columns[cols.index(key)]
-    people = []
-    for _, row in df.iterrows():
-        name = str(row.get(col_map.get("name", "name"), row.get(0, ""))).strip()
-        if not name: continue
-        gender = normalize_gender(row.get(col_map.get("gender", "gender"), None))
-        group = row.get(col_map.get("group", "group"), None)
-        try: group = int(group) if pd.notna(group) else None
-        except Exception: group = None
-        people.append({"name": name, "gender": gender, "group": group})
-    return people
-
-def flat_positions(rows, cols): return list(itertools.product(range(rows), range(cols)))
-
-def shuffle_seats(seed=None):
-    """
-    좌석을 셔플합니다.
-    - seed가 None이면 실행 때마다 다른 배치
-    - seed(숫자/문자)를 주면 항상 같은 결과 → '재현' 가능
-    """
+def ensure_conflicts(rules, apart):
+    """규칙 점검기를 격자·규칙에 맞게 준비 (셔플·크기 변경·규칙 변경 때만 전체 계산)"""
     ss = st.session_state
-    rng = random.Random(seed)
-    targets = [(i,j) for i,j in flat_positions(ss.rows, ss.cols) if not ss.locked[i][j]]
-    pool = ss.people.copy()
-    need = len(targets)
-    if len(pool) < need:
-        pool = pool + [{"name": "빈자리", "gender": None, "group": None} for _ in range(need - len(pool))]
-    else:
-        pool = pool[:need]
-    rng.shuffle(pool)
-    for (i,j), person in zip(targets, pool):
-        ss.seats[i][j] = person
-
-def swap(a, b):
-    (i1,j1),(i2,j2) = a,b
-    st.session_state.seats[i1][j1], st.session_state.seats[i2][j2] = \
-        st.session_state.seats[i2][j2], st.session_state.seats[i1][j1]
-
-def seats_to_dataframe() -> pd.DataFrame:
-    data = []
-    for i,row in enumerate(st.session_state.seats, start=1):
-        for j,person in enumerate(row, start=1):
-            if person is None: person = {"name":"", "gender":None, "group":None}
-            data.append({"row":i, "col":j, **person})
-    return pd.DataFrame(data)
-
-def render_png(font_bytes: Optional[bytes]=None, cell=(240,130), margin=24) -> bytes:
-    rows, cols = st.session_state.rows, st.session_state.cols
-    cw, ch = cell
-    w, h = cols*cw + margin*2, rows*ch + margin*2
-    img = Image.new("RGB", (w, h), (15,23,42))
-    draw = ImageDraw.Draw(img)
-    font = None; badge_font = None
-    try:
-        if font_bytes:
-            font = ImageFont.truetype(io.BytesIO(font_bytes), 22)
-            badge_font = ImageFont.truetype(io.BytesIO(font_bytes), 16)
-    except Exception:
-        font = None
-    if font is None: font = ImageFont.load_default()
-    if badge_font is None: badge_font = font
-
-    def fill_color(g):
-        if g == "M": return (31,59,104)
-        if g == "F": return (90,47,79)
-        return (37,50,71)
-
-    for i in range(rows):
-        for j in range(cols):
-            x0, y0 = margin + j*cw, margin + i*ch
-            person = st.session_state.seats[i][j]
-            name  = (person or {}).get("name","")
-            gender= (person or {}).get("gender",None)
-            group = (person or {}).get("group",None)
-            draw.rounded_rectangle([x0, y0, x0+cw-1, y0+ch-1], radius=18,
-                                   fill=fill_color(gender), outline=(56,189,248), width=3)
-            if group:
-                bx0, by0 = x0+10, y0+8
-                draw.rounded_rectangle([bx0,by0,bx0+42,by0+24], radius=8,
-                                       outline=(148,163,184), width=1, fill=(2,6,23))
-                draw.text((bx0+10,by0+6), str(group), fill=(226,232,240), font=badge_font)
-            if name:
-                draw.text((x0 + 20, y0 + (ch - 20)/2), name, fill=(226,232,240), font=font)
-    buf = io.BytesIO(); img.save(buf, format="PNG"); return buf.getvalue()
+    t = ss.conflicts
+    if t is None or t.shape != (ss.rows, ss.cols) or t.rules != set(rules) or t.apart != apart:
+        ss.conflicts = ConflictTracker(ss.rows, ss.cols, apart, rules).rebuild(ss.seats)
+
+@st.cache_resource
+def shared_store() -> Store:
+    return Store()
+
+EXPORTS = {"PNG": ("png", "image/png"), "SVG": ("svg", "image/svg+xml"), "PDF": ("pdf", "application/pdf")}
 
 # ============================ Sidebar ============================
 with st.sidebar:
@@ -236,26 +127,46 @@ with st.sidebar:
         cols = st.number_input("열(세로)", 1, 12, st.session_state.cols)   # ← 열
     if rows != st.session_state.rows or cols != st.session_state.cols:
         st.session_state.rows, st.session_state.cols = int(rows), int(cols)
-        resize_grid(int(rows), int(cols))
+        st.session_state.seats, st.session_state.locked = resize_grid(
+            st.session_state.seats, st.session_state.locked, int(rows), int(cols))
 
     st.markdown("### 🧑‍🤝‍🧑 이름/성별/조 입력")
     up = st.file_uploader("CSV 업로드 (name, gender, group)", type=["csv"])
     txt = st.text_area("직접 입력(이름[,성별][,조])", height=160)
-    if st.button("명단 적용/갱신", use_container_width=True):
+    if st.button("명단 적용/갱신", use_container_width=True) and allow(st.session_state, "roster"):
         people = []
         if up is not None: people += parse_uploaded(up)
         if txt.strip(): people += parse_text_lines(txt)
         st.session_state.people = [p for p in people if p["name"]]
         st.success(f"명단 {len(st.session_state.people)}명 적용!")
 
+    # 세션 상태는 worker 프로세스 안에만 있으므로, 다른 기기·다른 worker에서 쓸 명단은 공유 저장소에 보관
+    with st.expander("🗄️ 반 명단 보관함"):
+        class_code = st.text_input("반 이름", placeholder="예: 2학년 3반", key="class_code").strip()
+        k1, k2 = st.columns(2)
+        if k1.button("보관", use_container_width=True, disabled=not (class_code and st.session_state.people)):
+            shared_store().put("roster", class_code, st.session_state.people)
+            st.success(f"'{class_code}' 명단 {len(st.session_state.people)}명 보관!")
+        if k2.button("불러오기", use_container_width=True, disabled=not class_code):
+            saved = shared_store().get("roster", class_code)
+            if saved:
+                st.session_state.people = saved
+                st.session_state.conflicts = None
+                st.success(f"'{class_code}' 명단 {len(saved)}명 불러옴!")
+            else:
+                st.warning(f"'{class_code}' 이름으로 보관된 명단이 없습니다.")
+        names = shared_store().keys("roster")
+        if names: st.caption("보관된 반: " + ", ".join(names[:10]))
+
     st.markdown("### 👥 조 편성")
     group_cnt = st.number_input("조 개수(자동 배정)", 0, 20, 0)
-    if st.button("조 자동 배정 (라운드로빈)", use_container_width=True):
+    if st.button("조 자동 배정 (라운드로빈)", use_container_width=True) and allow(st.session_state, "groups"):
         if group_cnt > 0 and st.session_state.people:
             g = 1
             for p in st.session_state.people:
                 p["group"] = g
                 g = (g % group_cnt) + 1
+            st.session_state.conflicts = None
             st.success("조 번호 자동 배정 완료!")
 
     st.markdown("### 🎛️ 동작")
@@ -273,86 +184,198 @@ with st.sidebar:
 
     c3, c4 = st.columns(2)
     with c3:
-        if st.button("🎲 셔플", use_container_width=True):
-            shuffle_seats(seed if seed else None)
+        if st.button("🎲 셔플", use_container_width=True) and allow(st.session_state, "shuffle"):
+            shuffle_seats(st.session_state.seats, st.session_state.locked, st.session_state.people, seed if seed else None)
+            st.session_state.conflicts = None
     with c4:
-        if st.button("↺ 초기화", use_container_width=True):
-            st.session_state.seats = [[None for _ in range(st.session_state.cols)] for __ in range(st.session_state.rows)]
-            st.session_state.locked = [[False for _ in range(st.session_state.cols)] for __ in range(st.session_state.rows)]
+        if st.button("↺ 초기화", use_container_width=True) and allow(st.session_state, "reset"):
+            st.session_state.seats = empty_grid(st.session_state.rows, st.session_state.cols)
+            st.session_state.locked = empty_grid(st.session_state.rows, st.session_state.cols, False)
             st.session_state.selecting = None
+            st.session_state.conflicts = None
+
+    # 전학·전출: 바뀐 학생만 반영하고 나머지는 제자리 (🔒 자리에는 새 학생을 앉히지 않음)
+    compact = st.checkbox("빈자리 앞으로 당기기", value=False, help="나간 학생 자리를 뒤쪽 학생으로 채웁니다. (빈자리 하나당 1명 이동)")
+    if st.button("♻️ 명단 변경분만 반영", use_container_width=True) and allow(st.session_state, "reseat"):
+        rep = reseat(st.session_state.seats, st.session_state.locked, st.session_state.people,
+                     seed if seed else None, compact=compact)
+        st.session_state.selecting = None
+        st.session_state.conflicts = None
+        st.success(f"유지 {rep['kept']}명 · 전출 {len(rep['removed'])}명 · 전입 {len(rep['added'])}명 · 이동 {rep['moved']}명")
+        if rep["unseated"]:
+            st.warning(f"빈자리가 부족해 {len(rep['unseated'])}명을 앉히지 못했습니다: {', '.join(rep['unseated'])}")
+        if rep["duplicates"]:
+            st.info(f"같은 이름이 여러 명 있습니다: {', '.join(rep['duplicates'])} — 명단 순서와 자리(앞줄부터) 순서대로 짝지었습니다. 바뀐 자리가 있는지 확인하세요.")
+
+    # 자리 교환은 보드만 다시 실행하므로, CSV는 누른 시점의 배치로 생성
+    if st.button("📄 CSV 생성", use_container_width=True):
+        csv = seats_to_dataframe(st.session_state.seats).to_csv(index=False).encode("utf-8-sig")
+        st.download_button("⬇️ CSV 저장", data=csv, file_name="seating.csv",
+                           mime="text/csv", use_container_width=True)
+
+    st.markdown("### 🚦 규칙 점검")
+    active_rules = [r for r in RULES if st.checkbox(RULE_LABELS[r], value=True, key=f"rule_{r}")]
+    apart_txt = st.text_area("떨어뜨릴 학생 (한 줄에 '이름-이름')", height=80)
+    ensure_conflicts(active_rules, parse_apart(apart_txt))
+
+    st.markdown("### 🖼️ 좌석표 내보내기")
+    # 폰트는 한 번 올리면 공유 저장소에 보관 (serve의 어느 worker에서든 목록에서 고름, RETRO_FONT면 기본 폰트)
+    font_file = st.file_uploader("한글 폰트 TTF(선택, PDF는 필수)", type=["ttf"])
+    if font_file is not None and st.session_state.get("font_file_id") != font_file.file_id:
+        st.session_state.font_key = register_font(font_file.getvalue(), font_file.name)
+        st.session_state.font_file_id = font_file.file_id
+    fonts = dict(registered())
+    keys = [None] + list(fonts)
+    current = st.session_state.get("font_key") or default_font()
+    font_key = st.selectbox("폰트", keys, index=keys.index(current) if current in fonts else 0,
+                            format_func=lambda k: "기본 글꼴 (한글 없음)" if k is None else fonts[k])
+    st.session_state.font_key = font_key
+    fmt = st.radio("형식", list(EXPORTS), horizontal=True,
+                   help="SVG/PDF는 벡터라 크게 인쇄해도 선명하고, 명단 글자만 서브셋한 폰트를 넣어 용량이 작습니다.")
+    if st.button("🧷 좌석표 생성", use_container_width=True):
+        if font_key and font_data(font_key) is None:
+            font_key = None; st.warning("보관 기간이 지난 폰트입니다. 다시 올려 주세요.")
+        ext, mime = EXPORTS[fmt]
+        try:
+            if fmt == "PNG": data = render_png(st.session_state.seats, font_key=font_key)
+            elif fmt == "SVG": data = render_svg(st.session_state.seats, font_key=font_key)
+            elif font_key: data = render_pdf(st.session_state.seats, font_key=font_key)
+            else: data = None; st.warning("PDF에는 한글 폰트(TTF)가 필요합니다.")
+        except ImportError:
+            data = None; st.warning("SVG/PDF 내보내기에는 fontTools가 필요합니다: pip install fonttools")
+        if data:
+            st.download_button(f"⬇️ {fmt} 다운로드", data=data, file_name=f"seating.{ext}",
+                               mime=mime, use_container_width=True)
 
-    csv = seats_to_dataframe().to_csv(index=False).encode("utf-8-sig")
-    st.download_button("⬇️ CSV 저장", data=csv, file_name="seating.csv",
-                       mime="text/csv", use_container_width=True)
+# ============================ 보드 ============================
+# 좌석 선택/교환/잠금은 이 보드 블록만 다시 실행 (사이드바·명단 파싱은 그대로)
+# 콜백에서 상태를 바꾸므로 보드를 그리기 전에 반영됨
+# 같은 칸을 두 번 눌러도(느린 네트워크) 선택→취소로 뒤집히지 않도록 칸을 토큰으로 게이트 통과
+def cb_seat(cell):
+    ss = st.session_state
+    if not allow(ss, "seat", cell): return
+    if ss.selecting is None:
+        ss.selecting = cell
+    else:
+        if ss.selecting != cell:
+            swap(ss.seats, ss.selecting, cell)
+            ss.conflicts.update(ss.seats, [ss.selecting, cell])
+        ss.selecting = None
 
-    st.markdown("### 🖼️ PNG 내보내기")
-    font_file = st.file_uploader("한글 폰트 TTF(선택)", type=["ttf"])
-    if st.button("🧷 PNG 생성", use_container_width=True):
-        font_bytes = font_file.read() if font_file else None
-        png = render_png(font_bytes=font_bytes)
-        st.download_button("⬇️ PNG 다운로드", data=png, file_name="seating.png",
-                           mime="image/png", use_container_width=True)
+def cb_lock(cell):
+    ss = st.session_state
+    if not allow(ss, "lock", cell): return
+    ss.locked[cell[0]][cell[1]] = not ss.locked[cell[0]][cell[1]]
+    ss.conflicts.update(ss.seats, [cell])
+
+@st.fragment
+def seat_board():
+    st.markdown('<div class="retro-card crt">', unsafe_allow_html=True)
+    st.markdown(
+        "#### 🧩 칠판(정면)  "
+        "<span class='legend-pill'>Click 2회 → 자리교환</span>  "
+        "<span class='legend-pill'>🔒 → 셔플 제외</span>",
+        unsafe_allow_html=True
+    )
 
-# ============================ 보드 ============================
-st.markdown('<div class="retro-card crt">', unsafe_allow_html=True)
-st.markdown(
-    "#### 🧩 칠판(정면)  "
-    "<span class='legend-pill'>Click 2회 → 자리교환</span>  "
-    "<span class='legend-pill'>🔒 → 셔플 제외</span>",
-    unsafe_allow_html=True
-)
-
-cols_container = st.columns(st.session_state.cols, vertical_alignment="center", gap="small")
-
-for j, col in enumerate(cols_container):
-    with col:
-        for i in range(st.session_state.rows):
-            person = st.session_state.seats[i][j]
-            locked = st.session_state.locked[i][j]
-            label = (person or {}).get("name") or "빈자리"
-            gender = (person or {}).get("gender")
-            group  = (person or {}).get("group")
-            klass = "male" if gender == "M" else ("female" if gender == "F" else "neutral")
-
-            b1, b2 = st.columns([4, 1])
-
-            # 좌석 카드
-            with b1:
-                badge_html = f"<div class='badge'>#{group}</div>" if group else ""
-                card_html = (
-                    f"<div class='seat {klass} {'locked' if locked else ''}' style='position:relative;'>"
-                    + badge_html
-                    + f"<div class='nick'>{label}</div>"
-                    + "</div>"
-                )
-                st.markdown(card_html, unsafe_allow_html=True)
-
-                if st.button("선택" if not locked else "보기",
-                             key=f"seat_{i}_{j}",
-                             use_container_width=True,
-                             disabled=locked):
-                    if st.session_state.selecting is None:
-                        st.session_state.selecting = (i, j)
-                    else:
-                        if st.session_state.selecting != (i, j):
-                            swap(st.session_state.selecting, (i, j))
-                        st.session_state.selecting = None
-
-            # 잠금 토글
-            with b2:
-                if st.button("🔒" if not locked else "🔓", key=f"lock_{i}_{j}"):
-                    st.session_state.locked[i][j] = not locked
-
-st.markdown("</div>", unsafe_allow_html=True)
-
-# 상태 표시
-sel = st.session_state.selecting
-st.markdown(
-    f"<p class='small'>상태: {'교환할 좌석을 하나 더 선택하세요.' if sel else '대기 중'}"
-    + (f" → 선택1: ({sel[0]+1}행, {sel[1]+1}열)" if sel else "")
-    + "</p>",
-    unsafe_allow_html=True
-)
+    tracker = st.session_state.conflicts
+    bad = tracker.cell_reasons()
+    st.markdown(
+        f"<p class='small'>🚦 규칙 위반 {tracker.count}쌍"
+        + "".join(f" · {RULE_LABELS[r]} {sum(r in v for v in tracker.edges.values())}" for r in RULES if r in tracker.rules)
+        + "</p>",
+        unsafe_allow_html=True
+    )
+
+    cols_container = st.columns(st.session_state.cols, vertical_alignment="center", gap="small")
+
+    for j, col in enumerate(cols_container):
+        with col:
+            for i in range(st.session_state.rows):
+                person = st.session_state.seats[i][j]
+                locked = st.session_state.locked[i][j]
+                label = (person or {}).get("name") or "빈자리"
+                gender = (person or {}).get("gender")
+                group  = (person or {}).get("group")
+                klass = "male" if gender == "M" else ("female" if gender == "F" else "neutral")
+
+                b1, b2 = st.columns([4, 1])
+
+                # 좌석 카드
+                with b1:
+                    badge_html = f"<div class='badge'>#{group}</div>" if group else ""
+                    reasons = bad.get((i, j))
+                    warn_html = (f"<div class='warn' title='{', '.join(RULE_LABELS[r] for r in sorted(reasons))}'>!</div>"
+                                 if reasons else "")
+                    card_html = (
+                        f"<div class='seat {klass} {'locked' if locked else ''} {'conflict' if reasons else ''}' style='position:relative;'>"
+                        + badge_html + warn_html
+                        + f"<div class='nick'>{label}</div>"
+                        + "</div>"
+                    )
+                    st.markdown(card_html, unsafe_allow_html=True)
+
+                    st.button("선택" if not locked else "보기",
+                              key=f"seat_{i}_{j}",
+                              use_container_width=True,
+                              disabled=locked,
+                              on_click=cb_seat, args=((i, j),))
+
+                # 잠금 토글
+                with b2:
+                    st.button("🔒" if not locked else "🔓", key=f"lock_{i}_{j}", on_click=cb_lock, args=((i, j),))
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # 상태 표시
+    sel = st.session_state.selecting
+    suppressed = gate_for(st.session_state).total_suppressed
+    st.markdown(
+        f"<p class='small'>상태: {'교환할 좌석을 하나 더 선택하세요.' if sel else '대기 중'}"
+        + (f" → 선택1: ({sel[0]+1}행, {sel[1]+1}열)" if sel else "")
+        + (f" · 중복 클릭 {suppressed}회 무시됨" if suppressed else "")
+        + "</p>",
+        unsafe_allow_html=True
+    )
+
+seat_board()
+
+# ============================ 시험장 배치 모드 ============================
+# 여러 교실 × 전교생 배치. 좌석 보드와 따로 다시 실행되는 블록
+@st.fragment
+def exam_hall():
+    with st.expander("🏫 시험장 배치 모드 (여러 교실 · 같은 반 인접 금지)"):
+        c1, c2 = st.columns(2)
+        with c1:
+            rooms_txt = st.text_area("시험실 (이름, 행, 열[, 막힌자리 2-3 4-1] 또는 이름, 정원)",
+                                     value="1실, 5, 6\n2실, 5, 6, 1-1 1-6\n3실, 28", height=160)
+        with c2:
+            exam_up = st.file_uploader("학생 CSV (name, homeroom)", type=["csv"], key="exam_csv")
+            exam_txt = st.text_area("직접 입력(이름, 반)", height=100, key="exam_txt")
+        exam_seed = st.text_input("💾 씨드", placeholder="예: 2025-중간고사", key="exam_seed")
+
+        if st.button("🏫 시험장 배치 실행", type="primary") and allow(st.session_state, "exam"):
+            rooms = parse_rooms(rooms_txt)
+            students = parse_exam_students(exam_txt, exam_up)
+            if not rooms or students.empty:
+                st.warning("시험실과 학생 명단을 입력해 주세요.")
+            else:
+                plan, conflicts, left = allocate_exam_hall(students, rooms, exam_seed if exam_seed else None)
+                st.session_state.exam_plan = plan
+                st.success(f"{len(rooms)}개 시험실에 {len(plan)}명 배치 완료! (같은 반 인접 {conflicts}곳)")
+                if left:
+                    st.warning(f"좌석이 부족해 {left}명이 배치되지 않았습니다.")
+
+        plan = st.session_state.get("exam_plan")
+        if plan is not None and not plan.empty:
+            room = st.selectbox("시험실 보기", list(dict.fromkeys(plan["room"])))
+            g = plan[plan["room"] == room]
+            chart = g.pivot(index="row", columns="col", values="name").fillna("")
+            st.dataframe(chart, use_container_width=True)
+            st.download_button("⬇️ 시험실별 좌석표 + 전체 CSV (zip)", data=exam_hall_zip(plan),
+                               file_name="exam_hall.zip", mime="application/zip")
+
+exam_hall()
 
 # 처음 부팅 시 예시 데이터
 if "booted" not in st.session_state:
@@ -369,7 +392,8 @@ if "booted" not in st.session_state:
             {"name":"Oli","gender":"M","group":4},{"name":"Pyo","gender":"M","group":4},
         ]
         st.session_state.people = demo
-        shuffle_seats()
+        shuffle_seats(st.session_state.seats, st.session_state.locked, demo)
+        st.session_state.conflicts.rebuild(st.session_state.seats)
 
 # ============================ Sticky Footer ============================
 st.markdown("""
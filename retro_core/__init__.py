@@ -0,0 +1,15 @@
+# retro_core: Streamlit 없이 쓸 수 있는 학급 도구 로직
+# pages/*.py는 이 패키지 위에 화면만 얹은 얇은 뷰이고, 일괄 처리는 `python -m retro_core`
+from retro_core.mbti import QUESTIONS, CHOICES, score_mbti, profile_for
+from retro_core.praise import DEFAULT_COMPLIMENTS, draw_praise
+from retro_core.roulette import DEFAULT_ROLES, spin, batch_assign, parse_role_caps
+from retro_core.seating import parse_text_lines, parse_uploaded, shuffle_seats, swap, seats_to_dataframe, render_png
+from retro_core.exam_hall import allocate_exam_hall
+
+__all__ = [
+    "QUESTIONS", "CHOICES", "score_mbti", "profile_for",
+    "DEFAULT_COMPLIMENTS", "draw_praise",
+    "DEFAULT_ROLES", "spin", "batch_assign", "parse_role_caps",
+    "parse_text_lines", "parse_uploaded", "shuffle_seats", "swap", "seats_to_dataframe", "render_png",
+    "allocate_exam_hall",
+]
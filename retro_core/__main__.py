@@ -0,0 +1,3 @@
+from retro_core.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,70 @@
+# retro_core/actions.py
+# 버튼 동작 중복 방지 (느린 와이파이에서 두 번 눌림 → 재실행 두 번 / 상태 두 번 변경 막기)
+# - 동작마다 (이름, 토큰) 키를 붙이고, 같은 키가 window초 안에 다시 오면 무시
+#   토큰 = 같은 동작 안에서 '다른 의도'를 구분하는 값 (예: 좌석 칸). 없으면 동작 이름만으로 판단
+# - 애니메이션처럼 오래 걸리는 동작은 hold()로 바쁜 시간을 걸어 두면, 그동안 들어온 클릭은 흡수
+#   (상태는 먼저 바꾸고 연출은 그 뒤에 → 중간에 재실행이 끼어도 결과는 한 번만 반영)
+# 세션마다 ActionGate 하나를 session_state에 두고 씀 (Streamlit 불필요, 시각은 time.monotonic)
+import time
+from collections import Counter
+from typing import Dict, Hashable, MutableMapping, Optional, Tuple
+
+STATE_KEY = "_action_gate"
+DEFAULT_WINDOW = 0.6   # 초: 두 번 눌림으로 볼 간격
+
+class ActionGate:
+    """
+    동작 허용/무시 판단과 통계.
+    - last: {(동작, 토큰): 마지막으로 허용한 시각}
+    - busy: {동작: 바쁨이 끝나는 시각}
+    - accepted / suppressed: 동작별 허용·무시 횟수
+    """
+    def __init__(self, window: float = DEFAULT_WINDOW):
+        self.window = window
+        self.last: Dict[Tuple[str, Hashable], float] = {}
+        self.busy: Dict[str, float] = {}
+        self.accepted: Counter = Counter()
+        self.suppressed: Counter = Counter()
+
+    def allow(self, action: str, token: Hashable = None, now: Optional[float] = None) -> bool:
+        """이번 클릭을 실행할지 (False면 무시하고 횟수만 셈)"""
+        now = time.monotonic() if now is None else now
+        key = (action, token)
+        if self.busy.get(action, 0.0) > now or now - self.last.get(key, float("-inf")) < self.window:
+            self.suppressed[action] += 1
+            return False
+        self.last[key] = now
+        self.accepted[action] += 1
+        return True
+
+    def hold(self, action: str, seconds: float, now: Optional[float] = None):
+        """action을 seconds초 동안 바쁨으로 표시 (그동안의 클릭은 흡수)"""
+        now = time.monotonic() if now is None else now
+        self.busy[action] = max(self.busy.get(action, 0.0), now + seconds)
+
+    def release(self, action: str):
+        self.busy.pop(action, None)
+
+    @property
+    def total_suppressed(self) -> int:
+        return sum(self.suppressed.values())
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """동작 → (허용, 무시)"""
+        return {a: (self.accepted[a], self.suppressed[a]) for a in sorted(set(self.accepted) | set(self.suppressed))}
+
+def gate_for(state: MutableMapping) -> ActionGate:
+    """세션 상태(st.session_state 등)에 붙은 게이트 (없으면 만듦)"""
+    if STATE_KEY not in state: state[STATE_KEY] = ActionGate()
+    return state[STATE_KEY]
+
+def allow(state: MutableMapping, action: str, token: Hashable = None) -> bool:
+    """if st.button(...) and allow(st.session_state, "draw"): 처럼 버튼 분기에 바로 씀"""
+    return gate_for(state).allow(action, token)
+
+def guarded(state: MutableMapping, action: str, fn, token: Hashable = None):
+    """on_click용: 게이트를 통과했을 때만 fn(*args, **kwargs) 실행"""
+    def cb(*args, **kwargs):
+        if gate_for(state).allow(action, token):
+            return fn(*args, **kwargs)
+    return cb
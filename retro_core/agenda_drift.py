@@ -0,0 +1,141 @@
+# retro_core/agenda_drift.py
+# 발표 진행표 정확도 측정 — 시간 가속 시뮬레이션 (실제 브라우저 아님)
+#
+#   python -m retro_core.agenda_drift --presenters 36 --minutes 3 --gap 20 --latency 0.1 --ppm 50
+#
+# - 화면 스크립트는 페이지가 쓰는 retro_core.timer.AGENDA_HTML의 <script>를 node에서 그대로 실행
+#   DOM·오디오는 기록용 가짜 객체, performance.now·setInterval은 가상 시계 → 2시간을 몇 초에 재생
+# - 서버 쪽은 retro_core.timer의 Agenda를 같은 가상 시계로 조작 (시작·일시정지·재개·다음)
+# - 교사 동작마다 재실행 = 새 화면: 서버가 계산한 경과 초를 latency초 뒤에 받은 브라우저가 그때부터 셈
+# - 브라우저 시계는 서버 시계보다 ppm만큼 빠르게(+)/느리게(-) 갈 수 있음
+# 측정: 구간이 실제로 바뀐 시각(효과음) − 일정상 시각, 남은 시간 숫자가 바뀐 시각의 오차, 'THE END' 시각 오차
+# 가정한 두 가지(전송 지연, 시계 오차) 밖의 요인(탭 비활성 시 타이머 지연 등)은 재현하지 않음
+import argparse, json, random, re, shutil, statistics, subprocess, sys
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from retro_core import timer
+
+HARNESS = r"""
+const vm = require("vm");
+const renders = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const out = [];
+for (const r of renders) {
+  const el = () => ({ textContent: "", className: "", style: {}, currentTime: 0,
+                      play() { out.push([r.id, now, "sfx"]); return Promise.resolve(); } });
+  const nodes = {};
+  let now = r.from, intervals = [];
+  const ctx = vm.createContext({
+    document: { getElementById: id => (nodes[id] = nodes[id] || el()) },
+    performance: { now: () => (now - r.clock0) * (1 + r.ppm * 1e-6) * 1000 },
+    setInterval: (fn, ms) => intervals.push([fn, ms]), Math, String, JSON, Promise,
+  });
+  vm.runInContext(r.script, ctx);
+  const step = intervals[0][1] / 1000 / (1 + r.ppm * 1e-6);
+  let prev = null;
+  for (; now < r.until; now += step) {
+    intervals[0][0]();
+    const cur = nodes.who.textContent + "|" + nodes.time.textContent + "|" + nodes.sub.textContent;
+    if (cur !== prev) { out.push([r.id, now, nodes.who.textContent, nodes.time.textContent, nodes.sub.textContent]); prev = cur; }
+  }
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+def teacher_actions(rng: random.Random, total: float, pauses: int, skips: int) -> List[Tuple[float, str]]:
+    """(일정 경과 초 기준은 아니고) 시작 후 실제 초 → 동작. 일시정지는 30초~5분 뒤 재개"""
+    acts = [(0.0, "start")]
+    for _ in range(pauses):
+        t = rng.uniform(60, total - 60)
+        acts += [(t, "pause"), (t + rng.uniform(30, 300), "resume")]
+    acts += [(rng.uniform(60, total - 60), "skip") for _ in range(skips)]
+    acts.sort()
+    # 일시정지 구간이 겹치면 안쪽 것은 버림
+    out, paused = [], False
+    for t, a in acts:
+        if a == "pause" and paused or a == "resume" and not paused: continue
+        if a == "pause": paused = True
+        if a == "resume": paused = False
+        out.append((t, a))
+    return out
+
+def simulate(presenters: int, minutes: float, gap: float, latency: float, ppm: float,
+             pauses: int = 3, skips: int = 2, seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    ag = timer.build_agenda([(f"발표{k+1:02d}", minutes * 60) for k in range(presenters)], gap)
+    script = re.search(r"<script>(.*)</script>", timer.AGENDA_HTML, re.S).group(1)
+    acts = teacher_actions(rng, ag.total, pauses, skips)
+
+    # 서버: 동작마다 Agenda를 바꾸고 그 순간의 상태를 화면 하나로 (latency 뒤 브라우저가 시작)
+    renders, snaps = [], []
+    for k, (t, act) in enumerate(acts):
+        getattr(timer, act)(ag, now=t)
+        snaps.append((t, replace(ag)))
+        state = json.dumps(timer.agenda_state(ag, sound=True, now=t), ensure_ascii=False)
+        renders.append({"id": k, "from": t + latency, "clock0": t + latency, "ppm": ppm,
+                        "script": script.replace("__STATE__", state)})
+    end_guess = acts[-1][0] + ag.total + 60
+    for k, r in enumerate(renders):
+        r["until"] = renders[k + 1]["from"] if k + 1 < len(renders) else end_guess
+
+    res = subprocess.run(["node", "-e", HARNESS], input=json.dumps(renders), capture_output=True, text=True, check=True)
+    events = json.loads(res.stdout)
+
+    def truth(t: float, k: int) -> Tuple[Optional[int], float]:
+        """실제 시각 t의 (구간 번호, 남은 초) — k번째 화면이 받은 서버 일정 기준
+        (동작 직후 latency 동안은 이전 화면이 옛 일정대로 계속 셈 → 그 차이는 숫자 오차가 아니라 전송 지연)"""
+        cur = timer.current(snaps[k][1], now=t)
+        return (None, 0.0) if cur is None else (cur[0], cur[2])
+
+    # 1) 구간 경계: 일정상 시각(건너뛰기 제외) vs 효과음이 울린 시각
+    skip_times = [t for t, a in acts if a == "skip"]
+    sfx = [e[1] for e in events if e[2] == "sfx"]
+    boundary_err = []
+    for (t0, snap), nxt in zip(snaps, snaps[1:] + [(end_guess, None)]):
+        if snap.paused_at is not None: continue
+        for end in snap.ends:
+            b = snap.started_at + snap.shift + end
+            if t0 < b < nxt[0] and not any(abs(b - s) < 1e-9 for s in skip_times):
+                hit = min((s for s in sfx if abs(s - b) < 5), default=None, key=lambda s: abs(s - b))
+                if hit is not None: boundary_err.append(hit - b)
+    # 2) 남은 시간 숫자: 같은 화면·같은 구간에서 "mm:ss"가 1초 줄어든 순간, 실제 남은 시간은 새 값 + 0.5초 (반올림 표시)
+    digit_err, prev = [], None
+    for e in events:
+        if e[2] == "sfx": continue
+        if prev and prev[0] == e[0] and prev[2] == e[2] and prev[4] == e[4] and e[3] != "00:00":
+            v = int(e[3][:2]) * 60 + int(e[3][3:])
+            if int(prev[3][:2]) * 60 + int(prev[3][3:]) == v + 1:
+                digit_err.append(truth(e[1], e[0])[1] - (v + 0.5))
+        prev = e
+    # 3) 끝: 'THE END'가 뜬 시각 vs 일정상 끝
+    last = snaps[-1][1]
+    planned_end = last.started_at + last.shift + last.total
+    shown_end = next((e[1] for e in events if e[2] == "THE END"), float("nan"))
+    return {"total": ag.total, "session": planned_end, "actions": len(acts) - 1, "boundaries": len(boundary_err),
+            "boundary_mean": statistics.mean(boundary_err) if boundary_err else 0.0,
+            "boundary_max": max(boundary_err, default=0.0), "boundary_min": min(boundary_err, default=0.0),
+            "digit_max": max(map(abs, digit_err), default=0.0), "end_err": shown_end - planned_end}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m retro_core.agenda_drift",
+                                     description="발표 진행표 2시간 정확도 (node에서 화면 스크립트를 가상 시계로 재생하는 시뮬레이션)")
+    parser.add_argument("--presenters", type=int, default=36, help="발표자 수 (기본: 36)")
+    parser.add_argument("--minutes", type=float, default=3, help="발표 시간(분) (기본: 3)")
+    parser.add_argument("--gap", type=float, default=20, help="교대 시간(초) (기본: 20)")
+    parser.add_argument("--latency", type=float, default=0.1, help="재실행 → 화면 시작까지 초 (기본: 0.1)")
+    parser.add_argument("--ppm", default="0,50,-50", help="브라우저 시계 오차 목록, ppm (기본: 0,50,-50)")
+    parser.add_argument("--pauses", type=int, default=3, help="일시정지 횟수 (기본: 3)")
+    parser.add_argument("--skips", type=int, default=2, help="'다음' 횟수 (기본: 2)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if not shutil.which("node"):
+        print("node가 필요합니다 (화면 스크립트를 실행).", file=sys.stderr); return 1
+    for ppm in [float(x) for x in args.ppm.split(",") if x.strip()]:
+        r = simulate(args.presenters, args.minutes, args.gap, args.latency, ppm, args.pauses, args.skips, args.seed)
+        print(f"{ppm:+6.0f} ppm | 일정 {r['total']/3600:.2f}시간 (교사 동작 {r['actions']}번) | 구간 경계 {r['boundaries']}곳"
+              f" 오차 평균 {r['boundary_mean']*1e3:+6.0f} ms, 범위 {r['boundary_min']*1e3:+6.0f}~{r['boundary_max']*1e3:+6.0f} ms"
+              f" | 숫자 최대 {r['digit_max']*1e3:5.0f} ms | 끝 {r['end_err']*1e3:+6.0f} ms", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
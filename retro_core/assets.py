@@ -0,0 +1,34 @@
+# retro_core/assets.py
+# 프로세스 전체가 함께 쓰는 자원 캐시 (효과음 MP3 / 룰렛 GIF)
+# - 세션·재실행과 상관없이 프로세스에서 한 번만 읽음 (lru_cache → 복사 없이 같은 객체를 돌려줌)
+# - 서버 시작 때 warmup.warm_up()이 미리 채움. 채우기 전에 불려도 그때 읽을 뿐 결과는 같음
+import base64
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+ROULETTE_GIF = "roulette_smooth.gif"
+SUCCESS_SOUND = "success1.mp3"
+MIME = {".mp3": "audio/mp3", ".gif": "image/gif", ".png": "image/png"}
+
+@lru_cache(maxsize=None)
+def asset_bytes(name: str) -> Optional[bytes]:
+    """assets 폴더의 파일 내용 (없으면 None)"""
+    path = ASSETS_DIR / name
+    return path.read_bytes() if path.is_file() else None
+
+@lru_cache(maxsize=None)
+def data_uri(name: str) -> Optional[str]:
+    """data:…;base64,… 형태 (HTML audio/img에 바로 넣는 용도)"""
+    data = asset_bytes(name)
+    if data is None: return None
+    mime = MIME.get(Path(name).suffix.lower(), "application/octet-stream")
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+@lru_cache(maxsize=None)
+def sfx_names() -> Tuple[str, ...]:
+    return tuple(p.name for p in sorted(ASSETS_DIR.glob("*.mp3"))) if ASSETS_DIR.exists() else ()
+
+def sfx_data_uris() -> List[str]:
+    return [data_uri(n) for n in sfx_names()]
@@ -0,0 +1,42 @@
+# retro_core/bench_reseat.py
+# 명단 변경 반영(reseat) 벤치마크: 격자 크기와 바뀐 인원 수에 따라 시간이 어떻게 느는지
+#
+#   python -m retro_core.bench_reseat --sizes 25,50,100,200 --changes 10,400
+#
+# - 크기마다 격자를 (20칸만 남기고) 채운 뒤, 명단 앞쪽 changes명을 빼고 새 학생 changes명을 넣어 reseat
+# - 같은 입력으로 repeat번 재서 가장 짧은 시간을 씀 (복사 시간은 뺌)
+# - 격자를 한 번만 훑으면 한 변이 2배일 때 약 4배, 바뀐 인원 수에는 거의 영향 없음
+import argparse, time
+from typing import Dict, List, Optional
+
+from retro_core.seating import empty_grid, reseat, shuffle_seats
+
+def bench(n: int, changes: int, repeat: int = 5, seed: int = 0) -> Dict:
+    seats, locked = empty_grid(n, n), empty_grid(n, n, False)
+    people = [{"name": f"s{k}", "gender": None, "group": None} for k in range(max(0, n * n - 20))]
+    shuffle_seats(seats, locked, people, seed=seed)
+    changes = min(changes, len(people))
+    new = people[changes:] + [{"name": f"new{k}", "gender": None, "group": None} for k in range(changes)]
+    best, rep = float("inf"), {}
+    for _ in range(repeat):
+        grid = [row[:] for row in seats]
+        t = time.perf_counter(); rep = reseat(grid, locked, new, seed=seed)
+        best = min(best, time.perf_counter() - t)
+    return {"size": n, "changes": changes, "time": best, "added": len(rep["added"]), "removed": len(rep["removed"])}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m retro_core.bench_reseat", description="명단 변경 반영: 격자 크기·바뀐 인원별 시간")
+    parser.add_argument("--sizes", default="25,50,100,200", help="격자 한 변 크기 목록 (기본: 25,50,100,200)")
+    parser.add_argument("--changes", default="10,400", help="바뀐 인원 수 목록 (기본: 10,400)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수, 가장 짧은 시간을 씀 (기본: 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    for n in [int(x) for x in args.sizes.split(",") if x.strip()]:
+        for changes in [int(x) for x in args.changes.split(",") if x.strip()]:
+            r = bench(n, changes, args.repeat, args.seed)
+            print(f"{n:>4}x{n:<4} | 바뀐 인원 {r['changes']:5d} (전출 {r['removed']:5d}, 전입 {r['added']:5d})"
+                  f" | {r['time']*1e3:8.2f} ms", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
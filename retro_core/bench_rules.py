@@ -0,0 +1,53 @@
+# retro_core/bench_rules.py
+# 자리 규칙 점검 벤치마크: 격자가 커져도 교환 한 번의 점검 비용이 일정한지 (전체 점검과 비교)
+#
+#   python -m retro_core.bench_rules --sizes 4,12,48,200 --swaps 20000
+#
+# - 크기마다 무작위 명단(성별·조·떨어뜨릴 쌍)으로 격자를 채우고 ConflictTracker.rebuild 시간을 잼 (전체 점검)
+# - 무작위 두 칸 교환 + update(두 칸) 을 swaps번 반복해 한 번당 평균 시간을 잼 (증분 점검)
+# - 끝나면 증분으로 유지한 위반 쌍이 처음부터 다시 점검한 결과와 같은지 확인
+import argparse, random, time
+from typing import Dict, List, Optional
+
+from retro_core.seat_rules import ConflictTracker
+from retro_core.seating import swap
+
+def random_seats(n: int, rng: random.Random) -> List[List[Dict]]:
+    return [[{"name": f"s{i}_{j}", "gender": rng.choice("MF"), "group": rng.randint(1, 6)} for j in range(n)]
+            for i in range(n)]
+
+def bench(n: int, swaps: int, seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    seats = random_seats(n, rng)
+    names = [p["name"] for row in seats for p in row]
+    apart = {frozenset(rng.sample(names, 2)) for _ in range(max(1, n * n // 10))} if len(names) > 1 else set()
+    tracker = ConflictTracker(n, n, apart)
+
+    t = time.perf_counter(); tracker.rebuild(seats); full = time.perf_counter() - t
+    cells = [(rng.randrange(n), rng.randrange(n), rng.randrange(n), rng.randrange(n)) for _ in range(swaps)]
+    t = time.perf_counter()
+    for i1, j1, i2, j2 in cells:
+        swap(seats, (i1, j1), (i2, j2))
+        tracker.update(seats, [(i1, j1), (i2, j2)])
+    per_swap = (time.perf_counter() - t) / swaps
+
+    check = ConflictTracker(n, n, apart).rebuild(seats)
+    return {"size": n, "full": full, "per_swap": per_swap, "count": tracker.count,
+            "match": check.edges == tracker.edges and check.count == tracker.count}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m retro_core.bench_rules", description="자리 규칙 점검: 전체 점검 vs 교환당 증분 점검")
+    parser.add_argument("--sizes", default="4,12,48,200", help="격자 한 변 크기 목록 (기본: 4,12,48,200)")
+    parser.add_argument("--swaps", type=int, default=20000, help="크기마다 교환 횟수 (기본: 20000)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    ok = True
+    for n in [int(x) for x in args.sizes.split(",") if x.strip()]:
+        r = bench(n, args.swaps, args.seed)
+        ok &= r["match"]
+        print(f"{n:>4}x{n:<4} | 전체 점검 {r['full']*1e3:8.2f} ms | 교환당 {r['per_swap']*1e6:6.1f} us"
+              f" | 위반 쌍 {r['count']:6d} | 전체 점검과 {'일치' if r['match'] else '불일치'}", flush=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
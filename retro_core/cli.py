@@ -0,0 +1,126 @@
+# retro_core/cli.py
+# 일괄 처리: 폴더 안의 명단/응답 파일을 여러 프로세스로 나눠 처리 (Streamlit 불필요)
+#
+#   python -m retro_core seating rosters/ -o out/ --cols 6 --seed 2025-2학기 --png
+#   python -m retro_core mbti responses/ -o out/
+#   python -m retro_core roles teams/ -o out/ --caps "팀장:1, 자료 조사:2" --rounds 4
+import argparse, math, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from retro_core.mbti import QUESTION_KEYS, score_mbti
+from retro_core.roulette import parse_role_caps, parse_team_csv, batch_assign
+from retro_core.seating import empty_grid, parse_text_lines, parse_uploaded, shuffle_seats, seats_to_dataframe, render_png
+
+def file_seed(seed: Optional[str], path: Path, suffix: str = "") -> Optional[str]:
+    """반(파일)마다 다르지만 같은 씨드로 다시 돌리면 같은 결과가 나오는 씨드"""
+    return f"{seed}-{path.stem}{suffix}" if seed else None
+
+def read_roster(path: Path) -> List[Dict]:
+    if path.suffix.lower() == ".txt":
+        return [p for p in parse_text_lines(path.read_text(encoding="utf-8-sig")) if p["name"]]
+    with open(path, "rb") as f:
+        return parse_uploaded(f)
+
+def run_seating(path: Path, out_dir: Path, opts: Dict) -> str:
+    people = read_roster(path)
+    cols = opts["cols"]
+    rows = opts["rows"] or max(1, math.ceil(len(people) / cols))
+    seats, locked = empty_grid(rows, cols), empty_grid(rows, cols, False)
+    shuffle_seats(seats, locked, people, file_seed(opts["seed"], path))
+    seats_to_dataframe(seats).to_csv(out_dir / f"{path.stem}_seating.csv", index=False, encoding="utf-8-sig")
+    if opts["png"]:
+        (out_dir / f"{path.stem}_seating.png").write_bytes(render_png(seats, font_bytes=opts["font_bytes"]))
+    return f"{path.name}: {len(people)}명 → {rows}×{cols}"
+
+def run_mbti(path: Path, out_dir: Path, opts: Dict) -> str:
+    """응답 CSV: 첫 열 이름, 이어서 문항 순서대로 선택지 문자열 또는 점수(-2~2)"""
+    df = pd.read_csv(path, dtype=str).fillna("보통 (0)")
+    rows = []
+    for values in df.itertuples(index=False):
+        answers = dict(zip(QUESTION_KEYS, values[1:]))
+        mbti, raw = score_mbti(answers)
+        rows.append({"name": values[0], "mbti": mbti, **raw})
+    pd.DataFrame(rows).to_csv(out_dir / f"{path.stem}_mbti.csv", index=False, encoding="utf-8-sig")
+    return f"{path.name}: {len(rows)}명 채점"
+
+def run_roles(path: Path, out_dir: Path, opts: Dict) -> str:
+    with open(path, "rb") as f:
+        members = parse_team_csv(f)
+    role_caps = parse_role_caps(opts["caps"])
+    rounds = []
+    for k in range(1, opts["rounds"] + 1):
+        df = batch_assign(members, role_caps, file_seed(opts["seed"], path, f"-{k}"))
+        df.insert(0, "회차", k)
+        rounds.append(df)
+    pd.concat(rounds, ignore_index=True).to_csv(out_dir / f"{path.stem}_roles.csv", index=False, encoding="utf-8-sig")
+    return f"{path.name}: {members['팀'].nunique()}개 팀 × {opts['rounds']}회차"
+
+JOBS = {"seating": run_seating, "mbti": run_mbti, "roles": run_roles}
+PATTERNS = {"seating": ("*.csv", "*.txt"), "mbti": ("*.csv",), "roles": ("*.csv",)}
+
+def run_job(kind: str, path: Path, out_dir: Path, opts: Dict) -> Tuple[bool, str]:
+    """프로세스 하나에서 파일 하나 처리 — 한 반의 실패가 전체 작업을 멈추지 않도록 메시지로 돌려줌"""
+    try:
+        return True, JOBS[kind](path, out_dir, opts)
+    except Exception as e:
+        return False, f"{path.name}: 실패 ({e})"
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m retro_core", description="레트로 학급 도구 일괄 처리")
+    sub = parser.add_subparsers(dest="kind", required=True)
+
+    def common(p):
+        p.add_argument("src", type=Path, help="명단/응답 파일이 든 폴더 (또는 파일 하나)")
+        p.add_argument("-o", "--out", type=Path, default=Path("out"), help="결과 폴더 (기본: out)")
+        p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="프로세스 수 (기본: CPU 수)")
+        p.add_argument("--seed", default=None, help="재현용 씨드 (파일 이름과 합쳐 반마다 다르게 적용)")
+
+    p = sub.add_parser("seating", help="명단(csv/txt) → 자리 배치 CSV(+PNG)")
+    common(p)
+    p.add_argument("--rows", type=int, default=0, help="행 수 (기본: 인원에 맞춰 자동)")
+    p.add_argument("--cols", type=int, default=6, help="열 수 (기본: 6)")
+    p.add_argument("--png", action="store_true", help="PNG 좌석표도 저장")
+    p.add_argument("--font", type=Path, default=None, help="PNG용 한글 폰트 TTF")
+
+    p = sub.add_parser("mbti", help="설문 응답 CSV → 유형/축 점수 CSV")
+    common(p)
+
+    p = sub.add_parser("roles", help="팀 CSV(name, group) → 회차별 역할 배정 CSV")
+    common(p)
+    p.add_argument("--caps", default="팀장:1, 서기:1, 자료 조사:2, 발표자:1, 시간 관리:1, 정리 담당:1",
+                   help="역할:정원 목록")
+    p.add_argument("--rounds", type=int, default=1, help="미리 뽑을 회차 수 (기본: 1)")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    src: Path = args.src
+    if src.is_dir():
+        files = sorted({f for pat in PATTERNS[args.kind] for f in src.glob(pat)})
+    else:
+        files = [src]
+    if not files:
+        print(f"{src}: 처리할 파일이 없습니다.", file=sys.stderr)
+        return 1
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    opts = {"seed": args.seed}
+    if args.kind == "seating":
+        opts.update(rows=args.rows, cols=args.cols, png=args.png,
+                    font_bytes=args.font.read_bytes() if args.font else None)
+    elif args.kind == "roles":
+        opts.update(caps=args.caps, rounds=args.rounds)
+
+    jobs = max(1, min(args.jobs, len(files)))
+    if jobs == 1:
+        results = [run_job(args.kind, f, args.out, opts) for f in files]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(run_job, [args.kind]*len(files), files, [args.out]*len(files), [opts]*len(files)))
+    for ok, line in results:
+        print(line, file=sys.stdout if ok else sys.stderr)
+    return 0 if all(ok for ok, _ in results) else 1
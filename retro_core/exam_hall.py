@@ -0,0 +1,158 @@
+# retro_core/exam_hall.py
+# 시험장 배치: 여러 교실 × 전교생, 같은 반 학생은 좌우·앞뒤로 붙지 않게
+import random, io, re, heapq, zipfile
+from typing import List, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+EMPTY, BLOCKED = -1, -2   # 시험장 격자 값: 0 이상 = 반(homeroom) 코드
+
+def parse_rooms(text: str, default_cols: int = 6) -> List[Dict]:
+    """
+    한 줄에 시험실 하나:
+    - '이름, 행, 열[, 막힌자리]'  막힌자리 = '2-3 4-1' (행-열, 1부터)
+    - '이름, 정원'                → 열 default_cols 기준으로 격자를 만들고 남는 칸은 막음
+    """
+    rooms = []
+    for line in text.splitlines():
+        parts = [p.strip() for p in line.split(",")]
+        if not parts[0]: continue
+        if len(parts) >= 3 and parts[1].isdigit() and parts[2].isdigit():
+            r, c = int(parts[1]), int(parts[2])
+            mask = np.zeros((r, c), dtype=bool)
+            for cell in (parts[3].split() if len(parts) >= 4 else []):
+                m = re.fullmatch(r"(\d+)-(\d+)", cell)
+                if m and 1 <= int(m.group(1)) <= r and 1 <= int(m.group(2)) <= c:
+                    mask[int(m.group(1))-1, int(m.group(2))-1] = True
+        elif len(parts) == 2 and parts[1].isdigit():
+            cap = int(parts[1])
+            c = min(default_cols, max(cap, 1)); r = -(-cap // c)
+            mask = np.zeros((r, c), dtype=bool)
+            mask.flat[cap:] = True
+        else:
+            continue
+        rooms.append({"name": parts[0], "blocked": mask})
+    return rooms
+
+def parse_exam_students(text: str = "", file=None) -> pd.DataFrame:
+    """이름, 반 — CSV(name, homeroom/class/반) 업로드 또는 '이름, 반' 줄 입력"""
+    frames = []
+    if file is not None:
+        df = pd.read_csv(file)
+        cols = [str(c).strip().lower() for c in df.columns]
+        key = next((k for k in ["homeroom", "class", "반"] if k in cols), None)
+        if "name" in cols and key:
+            df = df[[df.columns[cols.index("name")], df.columns[cols.index(key)]]]
+        else:
+            file.seek(0)
+            df = pd.read_csv(file, header=None).iloc[:, :2]
+        df.columns = ["name", "homeroom"]
+        frames.append(df)
+    rows = [[p.strip() for p in line.split(",", 1)] for line in text.splitlines() if line.strip()]
+    if rows:
+        frames.append(pd.DataFrame([(r[0], r[1] if len(r) > 1 else "") for r in rows], columns=["name", "homeroom"]))
+    if not frames: return pd.DataFrame(columns=["name", "homeroom"])
+    out = pd.concat(frames, ignore_index=True).astype(str)
+    out["name"] = out["name"].str.strip(); out["homeroom"] = out["homeroom"].str.strip()
+    return out[out["name"] != ""].reset_index(drop=True)
+
+def room_quotas(seats: List[int], n: int) -> List[int]:
+    """시험실별 인원: 쓸 수 있는 좌석 수에 비례 (최대 나머지 방식, 좌석 수를 넘지 않음)"""
+    total = sum(seats); n = min(n, total)
+    if not total: return [0] * len(seats)
+    raw = [n * s / total for s in seats]
+    quota = [int(x) for x in raw]
+    for k in sorted(range(len(seats)), key=lambda k: raw[k] - quota[k], reverse=True)[:n - sum(quota)]:
+        quota[k] += 1
+    return [min(q, s) for q, s in zip(quota, seats)]
+
+def allocate_exam_hall(students: pd.DataFrame, rooms: List[Dict], seed=None) -> Tuple[pd.DataFrame, int, int]:
+    """
+    전교생을 여러 시험실에 배치합니다.
+    - 시험실 인원은 쓸 수 있는 좌석 수에 비례(room_quotas) → 앞 교실만 꽉 차고 뒤는 비는 일 없음
+    - 반마다 학생을 시험실에 고르게 나눔 (반 순서로 줄 세운 뒤 정원 비율대로 번갈아 배정)
+    - 교실 안에서는 칸마다 (왼쪽·앞 칸의 반을 제외한) 남은 인원이 가장 많은 반을 고름 (힙, 칸당 O(log 반 수))
+    - 앉힐 반이 모두 이웃과 같으면, 교실에 남는 자리가 있을 때는 그 칸을 비워 둠
+      남는 자리가 없으면 뒤 시험실의 다른 반 학생과 맞바꾸고(borrow), 그것도 안 될 때만 규칙을 어기고 앉힘
+      → 같은 반끼리 붙은 쌍의 수를 conflicts로 돌려줌
+    - 좌석이 모자라면 인원이 많은 반의 학생부터 남음
+    반환: (배치표 DataFrame[room,row,col,name,homeroom], conflicts, 남은 학생 수)
+    """
+    rng = random.Random(seed)
+    codes, homerooms = pd.factorize(students["homeroom"])
+    people = list(zip(students["name"], codes))
+    rng.shuffle(people)
+    # 좌석이 모자라면 큰 반에서부터 남김 (반 안에서 순번이 뒤인 학생부터) → 앉는 반 인원이 고르게
+    rank, seen = [], [0] * len(homerooms)
+    for _, code in people:
+        rank.append(seen[code]); seen[code] += 1
+    people = [p for _, p in sorted(zip(rank, people), key=lambda x: x[0])]
+    quota = room_quotas([int((~room["blocked"]).sum()) for room in rooms], len(people))
+    seated, rest = people[:sum(quota)], people[sum(quota):]
+    seated.sort(key=lambda p: p[1])   # 안정 정렬: 반 안에서는 섞인 순서 유지
+    slots = sorted(((j + 0.5) / q, r) for r, q in enumerate(quota) for j in range(q))
+    pools = [[[] for _ in homerooms] for _ in rooms]
+    for (name, code), (_, r) in zip(seated, slots):
+        pools[r][code].append(name)
+
+    def borrow(r: int, give: int, banned: Tuple[int, int]) -> Optional[int]:
+        """뒤 시험실에서 이웃과 다른 반 학생 하나를 데려오고 give 반 학생 하나를 보냄 (정원 유지)"""
+        for later in pools[r+1:]:
+            code = next((c for c, pool in enumerate(later) if pool and c not in banned), None)
+            if code is None: continue
+            pools[r][code].append(later[code].pop()); later[give].append(pools[r][give].pop())
+            return code
+        return None
+
+    def make_heap(room_pools):
+        heap = [(-len(pool), rng.random(), code) for code, pool in enumerate(room_pools) if pool]
+        heapq.heapify(heap)
+        return heap
+
+    records, conflicts = [], 0
+    for r, (room, room_pools, todo) in enumerate(zip(rooms, pools, quota)):
+        grid = np.where(room["blocked"], BLOCKED, EMPTY).astype(np.int32)
+        free = int((grid != BLOCKED).sum())
+        heap = make_heap(room_pools)
+        R, C = grid.shape
+        for i in range(R):
+            for j in range(C):
+                if grid[i, j] == BLOCKED: continue
+                free -= 1
+                if not heap: continue
+                left, front = grid[i, j-1] if j else EMPTY, grid[i-1, j] if i else EMPTY
+                skipped = []
+                while heap and heap[0][2] in (left, front):
+                    skipped.append(heapq.heappop(heap))
+                borrowed = None
+                if heap:
+                    cnt, tie, code = heapq.heappop(heap)
+                elif free >= todo:
+                    # 남는 자리가 있으면 이 칸은 비움
+                    for item in skipped: heapq.heappush(heap, item)
+                    continue
+                else:
+                    borrowed = borrow(r, skipped[0][2], (left, front))
+                    if borrowed is None:
+                        # 어쩔 수 없이 붙일 때는 이웃 하나와만 겹치는 반을 먼저 (겹친 쌍마다 1씩 셈)
+                        k = min(range(len(skipped)), key=lambda k: (skipped[k][2] == left) + (skipped[k][2] == front))
+                        cnt, tie, code = skipped.pop(k)
+                        conflicts += int(code == left) + int(code == front)
+                if borrowed is not None: code = borrowed
+                grid[i, j] = code; todo -= 1
+                records.append((room["name"], i+1, j+1, room_pools[code].pop(), homerooms[code]))
+                if borrowed is not None:
+                    heap = make_heap(room_pools); continue
+                if cnt + 1 < 0: heapq.heappush(heap, (cnt + 1, tie, code))
+                for item in skipped: heapq.heappush(heap, item)
+    return pd.DataFrame(records, columns=["room", "row", "col", "name", "homeroom"]), conflicts, len(rest)
+
+def exam_hall_zip(plan: pd.DataFrame) -> bytes:
+    """시험실별 좌석표 CSV(행×열 격자) + 전체 명단 master.csv를 zip 하나로 묶음"""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("master.csv", plan.to_csv(index=False).encode("utf-8-sig"))
+        for room, g in plan.groupby("room", sort=False):
+            chart = g.pivot(index="row", columns="col", values="name").fillna("")
+            zf.writestr(f"{room}.csv", chart.to_csv().encode("utf-8-sig"))
+    return buf.getvalue()
@@ -0,0 +1,99 @@
+# retro_core/fonts.py
+# 좌석표 내보내기(PNG/SVG/PDF)에 쓰는 한글 폰트 보관소 (프로세스 전체 공용)
+# - 폰트는 내용 해시(blake2b)로 구분 → 캐시 키는 짧은 문자열. 10MB 넘는 bytes를 조회마다 해시·비교하지 않음
+# - 올린 폰트는 공유 저장소(Store, 이름공간 "font")에도 넣음 → serve의 다른 worker에서도 목록에 보이고 쓸 수 있음
+#   메모리에 없는 키는 저장소에서 읽어 옴. 메모리·저장소 모두 최대 MAX_FONTS개 (오래된 것부터 버림)
+# - 환경 변수 RETRO_FONT=TTF경로 면 서버 기본 폰트로 고정 등록 → 교실마다 올리지 않아도 PDF 가능
+import base64, hashlib, logging, os, sqlite3, threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from retro_core.store import Store
+
+log = logging.getLogger(__name__)
+
+MAX_FONTS = 4
+_uploaded: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()   # 키 → (파일 이름, 내용)
+_pinned: Dict[str, Tuple[str, bytes]] = {}                          # 서버 기본 폰트 (버리지 않음)
+_lock = threading.Lock()
+
+def font_key(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@lru_cache(maxsize=1)
+def _store() -> Optional[Store]:
+    """공유 저장소 (열 수 없으면 None → 이 worker 메모리에만 보관)"""
+    try: return Store()
+    except (OSError, sqlite3.Error):
+        log.exception("폰트 저장소를 열 수 없어 worker 메모리에만 보관합니다")
+        return None
+
+def _remember(key: str, name: str, data: bytes):
+    with _lock:
+        _uploaded[key] = (name, data)
+        _uploaded.move_to_end(key)
+        while len(_uploaded) > MAX_FONTS: _uploaded.popitem(last=False)
+
+def register_font(data: bytes, name: str = "") -> str:
+    """폰트를 보관하고 키를 돌려줌 (이미 있으면 최근 사용으로만 표시)"""
+    key = font_key(data)
+    with _lock:
+        if key in _pinned: return key
+        known = key in _uploaded
+        if known: _uploaded.move_to_end(key)
+    if known: return key
+    name = name or f"폰트 {key[:8]}"
+    _remember(key, name, data)
+    store = _store()
+    if store is not None:
+        try:
+            # 이름은 따로 두어 목록을 만들 때 폰트 내용까지 읽지 않음
+            store.put("font", key, base64.b64encode(data).decode("ascii"))
+            store.put("font_name", key, name)
+            for old in store.keys("font_name")[MAX_FONTS:]:
+                store.delete("font", old); store.delete("font_name", old)
+        except sqlite3.Error:
+            log.exception("폰트를 저장소에 넣지 못했습니다: %s", name)
+    return key
+
+def font_data(key: Optional[str]) -> Optional[bytes]:
+    """키 → 폰트 내용 (이 worker에 없으면 저장소에서, 어디에도 없으면 None)"""
+    if not key: return None
+    with _lock:
+        entry = _pinned.get(key) or _uploaded.get(key)
+        if key in _uploaded: _uploaded.move_to_end(key)
+    if entry: return entry[1]
+    store = _store()
+    encoded = store.get("font", key) if store is not None else None
+    if encoded is None: return None
+    data = base64.b64decode(encoded)
+    _remember(key, store.get("font_name", key) or f"폰트 {key[:8]}", data)
+    return data
+
+def resolve(font_bytes: Optional[bytes] = None, key: Optional[str] = None) -> Optional[str]:
+    """렌더 함수용: 키가 있으면 그대로, bytes만 있으면 등록해서 키로"""
+    if key: return key
+    return register_font(font_bytes) if font_bytes else None
+
+@lru_cache(maxsize=1)
+def default_font() -> Optional[str]:
+    """RETRO_FONT 폰트의 키 (없거나 못 읽으면 None)"""
+    path = os.environ.get("RETRO_FONT")
+    if not path or not Path(path).is_file(): return None
+    data = Path(path).read_bytes()
+    key = font_key(data)
+    with _lock: _pinned[key] = (Path(path).name, data)
+    return key
+
+def registered() -> List[Tuple[str, str]]:
+    """[(키, 파일 이름)] — 서버 기본 폰트, 그다음 최근에 올린 것부터 (다른 worker에서 올린 것 포함)"""
+    default_font()
+    store = _store()
+    stored = [(k, store.get("font_name", k)) for k in store.keys("font_name")] if store is not None else []
+    with _lock:
+        fonts = dict((k, n) for k, (n, _) in _pinned.items())
+        for k, n in stored + [(k, n) for k, (n, _) in reversed(_uploaded.items())]:
+            fonts.setdefault(k, n)
+    return list(fonts.items())
@@ -0,0 +1,196 @@
+# retro_core/loadtest.py
+# 로컬 부하 측정: 가상 교실 여러 개가 동시에 페이지를 열고 버튼을 누를 때의 처리량·지연(p50/p95)
+#
+#   python -m retro_core.loadtest --url http://127.0.0.1:8501 --users 16 --actions 10
+#   python -m retro_core.loadtest --sweep 1,2,4,8 --users 16 --actions 10     # worker 수별로 serve를 띄워 비교
+#   python -m retro_core.loadtest --first-request                              # 페이지별 첫 요청 지연 (워밍업 켬/끔)
+#   python -m retro_core.loadtest --interactions --url http://127.0.0.1:8501   # 자리 교환·칭찬 뽑기·룰렛 클릭별 실행 시간
+#
+# - 브라우저처럼 /_stcore/stream 웹소켓을 열고 Streamlit 메시지를 주고받음 (retro_core.stclient)
+# - 요청 하나 = 재실행 요청을 보낸 뒤 script_finished를 받을 때까지 (스크립트 실행 + 화면 전송 전체)
+# - 기본 시나리오: 자리 배치 페이지를 열고 [셔플] / [좌석표 생성(PNG)] 을 번갈아 누름
+import argparse, asyncio, os, signal, statistics, subprocess, sys, tempfile, time, urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from retro_core.stclient import PAGES, WebSocket, interact, run_script
+
+PAGE = "레트로_자리_랜덤_배치"
+ACTIONS = ("🎲 셔플", "🧷 좌석표 생성")
+
+# ============================ 가상 사용자 ============================
+async def virtual_user(host: str, port: int, actions: int, lat: List[float], errors: List[str]):
+    try:
+        ws = await WebSocket.connect(host, port)
+    except (OSError, ConnectionError) as e:
+        errors.append(str(e)); return
+    try:
+        t = time.perf_counter()
+        buttons = await run_script(ws, PAGE)
+        lat.append(time.perf_counter() - t)
+        for k in range(actions):
+            label = ACTIONS[k % len(ACTIONS)]
+            t = time.perf_counter()
+            buttons = await run_script(ws, PAGE, buttons.get(label)) or buttons
+            lat.append(time.perf_counter() - t)
+    except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+        errors.append(str(e))
+    finally:
+        ws.close()
+
+def p95(values: List[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1] if len(values) >= 2 else (values[0] if values else 0.0)
+
+async def load(url: str, users: int, actions: int) -> Dict:
+    u = urlparse(url)
+    lat, errors = [], []
+    t = time.perf_counter()
+    await asyncio.gather(*(virtual_user(u.hostname, u.port or 80, actions, lat, errors) for _ in range(users)))
+    wall = time.perf_counter() - t
+    return {"requests": len(lat), "errors": len(errors), "wall": wall, "rps": len(lat) / wall if wall else 0.0,
+            "p50": statistics.median(lat) if lat else 0.0, "p95": p95(lat)}
+
+# ============================ worker 수별 비교 ============================
+def wait_up(url: str, proc: subprocess.Popen, timeout: float = 120) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            with urllib.request.urlopen(url + "/_stcore/health", timeout=1) as r:
+                if r.status == 200: return True
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+def sweep(workers: List[int], users: int, actions: int, port: int) -> List[Tuple[int, Dict]]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in workers:
+            proc = subprocess.Popen([sys.executable, "-m", "retro_core.serve", "--workers", str(n), "--port", str(port),
+                                     "--address", "127.0.0.1", "--base-port", str(port + 100), "--store", str(Path(tmp) / "store.sqlite3")],
+                                    cwd=Path(__file__).resolve().parent.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                url = f"http://127.0.0.1:{port}"
+                if not wait_up(url, proc):
+                    print(f"worker {n}개: 시작 실패", file=sys.stderr); continue
+                asyncio.run(load(url, n, 1))          # 워밍업: worker마다 한 번씩 (첫 실행 import 비용 제외)
+                res = asyncio.run(load(url, users, actions))
+                rows.append((n, res))
+                print(report_line(n, res), flush=True)
+            finally:
+                proc.send_signal(signal.SIGTERM)
+                try: proc.wait(timeout=30)
+                except subprocess.TimeoutExpired: proc.kill()
+    return rows
+
+# ============================ 첫 요청 지연 ============================
+async def first_request(url: str, page: str) -> float:
+    u = urlparse(url)
+    ws = await WebSocket.connect(u.hostname, u.port or 80)
+    try:
+        t = time.perf_counter()
+        await run_script(ws, page)
+        return time.perf_counter() - t
+    finally:
+        ws.close()
+
+def first_request_table(port: int, repeat: int, settle: float) -> List[Tuple[str, float, float]]:
+    """페이지마다 새 서버를 띄워 (settle초 뒤) 첫 요청 지연을 잼 → [(페이지, 워밍업 끔, 워밍업 켬)] (중앙값, 초)"""
+    root = Path(__file__).resolve().parent.parent
+    url = f"http://127.0.0.1:{port}"
+    rows = []
+    for page in PAGES:
+        cells = []
+        for warm in ("0", "1"):
+            samples = []
+            for _ in range(repeat):
+                proc = subprocess.Popen([sys.executable, "-m", "retro_core.warmup", str(root / "streamlit_app.py"),
+                                         "--server.port", str(port), "--server.address", "127.0.0.1",
+                                         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+                                        cwd=root, env=dict(os.environ, RETRO_WARMUP=warm),
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                try:
+                    if wait_up(url, proc):
+                        time.sleep(settle)      # 서버가 켜진 뒤 첫 교실이 들어오기까지의 여유
+                        samples.append(asyncio.run(first_request(url, page)))
+                finally:
+                    proc.terminate()
+                    try: proc.wait(timeout=30)
+                    except subprocess.TimeoutExpired: proc.kill()
+            cells.append(statistics.median(samples) if samples else float("nan"))
+        rows.append((page or "홈", *cells))
+        print(f"{page or '홈':>14} | 워밍업 끔 {cells[0]*1e3:6.0f} ms | 켬 {cells[1]*1e3:6.0f} ms", flush=True)
+    return rows
+
+# ============================ 클릭별 실행 시간 ============================
+# 같은 시나리오를 어느 버전의 서버에든 돌릴 수 있도록 위젯은 라벨·key로만 찾음
+ROSTER = [f"학생{k:02d}" for k in range(30)]
+SCENARIOS = {
+    # 이름: (페이지, 명단 입력칸, 명단 저장 버튼, 준비 버튼들, {잴 클릭 이름: 버튼 라벨·key} — 차례로 반복)
+    "swap": ("레트로_자리_랜덤_배치", "직접 입력(이름[,성별][,조])", "명단 적용/갱신", ("🎲 셔플",),
+             {"select": "seat_0_0", "swap": "seat_0_1"}),
+    "draw": ("디지털_칭찬_상자", "학생 입력", "💾 학생 저장", (), {"draw": "▶ 오늘의 칭찬 주인공 뽑기"}),
+    "spin": ("역할_룰렛", "학생 목록 (쉼표/줄바꿈)", "목록 저장", (), {"spin": "🎯 룰렛 돌리기", "reset": "🔄 초기화"}),
+}
+GAP = 0.7   # 클릭 사이 간격: 중복 클릭 게이트(0.6초)에 걸리지 않게
+
+async def interaction_times(url: str, scenario: str, repeat: int) -> Dict[str, List[float]]:
+    page, roster_box, save, prep, clicks = SCENARIOS[scenario]
+    u = urlparse(url)
+    ws = await WebSocket.connect(u.hostname, u.port or 80)
+    try:
+        w = await interact(ws, page)
+        w = await interact(ws, page, w[save], {w[roster_box].id: "\n".join(ROSTER)})
+        for name in prep: w = await interact(ws, page, w[name])
+        times = {label: [] for label in clicks}
+        for _ in range(repeat):
+            for label, name in clicks.items():
+                await asyncio.sleep(GAP)
+                t = time.perf_counter()
+                w = {**w, **await interact(ws, page, w[name])}    # 조각만 다시 실행되면 그 조각 위젯만 옴
+                times[label].append(time.perf_counter() - t)
+        return times
+    finally:
+        ws.close()
+
+def interactions_table(url: str, repeat: int) -> Dict[str, float]:
+    """클릭 종류별 재실행 시간 중앙값 (초, 요청 전송 ~ script_finished)"""
+    rows = {}
+    for scenario in SCENARIOS:
+        for label, times in asyncio.run(interaction_times(url, scenario, repeat)).items():
+            rows[label] = statistics.median(times)
+            print(f"{label:>6} | 클릭 {len(times):3d}번 | 중앙값 {rows[label]*1e3:7.1f} ms | p95 {p95(times)*1e3:7.1f} ms", flush=True)
+    return rows
+
+def report_line(label, r: Dict) -> str:
+    return (f"{label!s:>4} | 요청 {r['requests']:4d} | 오류 {r['errors']:2d} | {r['rps']:6.1f} req/s"
+            f" | p50 {r['p50']*1e3:7.0f} ms | p95 {r['p95']*1e3:7.0f} ms")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m retro_core.loadtest", description="레트로 학급 도구 로컬 부하 측정")
+    parser.add_argument("--url", default="http://127.0.0.1:8501", help="측정할 서버 (기본: http://127.0.0.1:8501)")
+    parser.add_argument("--users", type=int, default=16, help="동시 접속 교실 수 (기본: 16)")
+    parser.add_argument("--actions", type=int, default=10, help="교실마다 누를 버튼 수 (기본: 10)")
+    parser.add_argument("--sweep", default=None, help="worker 수 목록 (예: 1,2,4,8) — 각각 serve를 띄워 측정")
+    parser.add_argument("--port", type=int, default=8790, help="--sweep 때 쓸 접속 포트 (기본: 8790)")
+    parser.add_argument("--first-request", action="store_true", help="페이지별 첫 요청 지연을 워밍업 켬/끔으로 비교")
+    parser.add_argument("--repeat", type=int, default=3, help="--first-request 반복 횟수 (기본: 3, 중앙값)")
+    parser.add_argument("--settle", type=float, default=5.0, help="--first-request 때 서버 시작 후 기다릴 초 (기본: 5)")
+    parser.add_argument("--interactions", action="store_true", help="자리 교환·칭찬 뽑기·룰렛 돌리기 클릭별 재실행 시간")
+    parser.add_argument("--clicks", type=int, default=10, help="--interactions 때 시나리오마다 누를 횟수 (기본: 10)")
+    args = parser.parse_args(argv)
+    if args.interactions:
+        return 0 if interactions_table(args.url, args.clicks) else 1
+    if args.first_request:
+        rows = first_request_table(args.port, args.repeat, args.settle)
+        return 0 if rows else 1
+    print(f"동시 {args.users}명 × 버튼 {args.actions}번 ({PAGE}: {' / '.join(ACTIONS)})")
+    if args.sweep:
+        rows = sweep([int(x) for x in args.sweep.split(",") if x.strip()], args.users, args.actions, args.port)
+        return 0 if rows and all(r["errors"] == 0 for _, r in rows) else 1
+    res = asyncio.run(load(args.url, args.users, args.actions))
+    print(report_line("-", res))
+    return 0 if res["errors"] == 0 else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+# retro_core/mbti.py
+# 8비트 학습 성향 진단: 문항 / 채점 / 유형별 공부 팁
+from typing import Dict, List, Tuple
+
+# 문항
+QUESTIONS = {
+    "EI": [
+        ("여럿이 함께 공부하면 에너지가 난다.", False),
+        ("발표/토론이 기대된다.", False),
+        ("혼자 공부가 더 편하고 집중이 잘 된다.", True),
+    ],
+    "SN": [
+        ("개념보다 예시/사례부터 보면 이해가 된다.", False),
+        ("세부 절차를 순서대로 따라 배우는 편이다.", False),
+        ("아이디어 확장/상상을 즐긴다.", True),
+    ],
+    "TF": [
+        ("정답/근거가 분명한 문제가 좋다.", False),
+        ("사람의 감정/관계도 중요하다.", True),
+        ("의사결정에 데이터/논리를 우선한다.", False),
+    ],
+    "JP": [
+        ("플래너로 일정 관리하고 계획대로 진행한다.", False),
+        ("마감 직전 몰입이 효율적일 때가 많다.", True),
+        ("계획이 바뀌어도 즉석에서 잘 대응한다.", True),
+    ],
+}
+CHOICES = ["매우 그렇다 (+2)", "그렇다 (+1)", "보통 (0)", "아니다 (-1)", "전혀 아니다 (-2)"]
+SCALE = {CHOICES[0]:2, CHOICES[1]:1, CHOICES[2]:0, CHOICES[3]:-1, CHOICES[4]:-2}
+DEFAULT_PROFILE = {"label":"맞춤 프로필","tips":["핵심 개념 정리","오답 원인 기록","주1회 메타인지 점검"]}
+
+LEARNING_PROFILES = {
+    "ISTJ": {"label":"체계적 실천가","tips":["단원 체크리스트","예제→변형→서술형","오답 원인 기록"]},
+    "ENFP": {"label":"아이디어 점프러","tips":["프로젝트 연결","할 일 3개 제한","5분 규칙으로 시작"]},
+    # 필요 시 나머지 유형 추가
+}
+
+# 문항 순서대로의 (축, 번호) 키 — 설문 내보내기의 Q01, Q02, ... 열과 같은 순서
+QUESTION_KEYS: List[Tuple[str, int]] = [(axis, i) for axis, items in QUESTIONS.items() for i in range(1, len(items) + 1)]
+
+def answer_value(choice) -> int:
+    """선택지 문자열('그렇다 (+1)') 또는 점수(-2~2)를 점수로 변환"""
+    if choice in SCALE: return SCALE[choice]
+    return max(-2, min(2, int(float(choice))))
+
+# 채점표: (문항 키, 축, 부호) — 역문항은 -1
+SCORING: List[Tuple[Tuple[str, int], str, int]] = [
+    ((axis, i), axis, -1 if rev else 1)
+    for axis, items in QUESTIONS.items() for i, (_q, rev) in enumerate(items, start=1)
+]
+
+def score_mbti(answers: Dict) -> Tuple[str, Dict[str, int]]:
+    raw = {"EI":0,"SN":0,"TF":0,"JP":0}
+    for key, axis, sign in SCORING:
+        raw[axis] += sign * answer_value(answers.get(key, CHOICES[2]))
+    mbti = ("E" if raw["EI"]>=0 else "I") + ("S" if raw["SN"]>=0 else "N") + ("T" if raw["TF"]>=0 else "F") + ("J" if raw["JP"]>=0 else "P")
+    return mbti, raw
+
+def profile_for(mbti: str) -> Dict:
+    return LEARNING_PROFILES.get(mbti, DEFAULT_PROFILE)
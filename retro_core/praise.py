@@ -0,0 +1,51 @@
+# retro_core/praise.py
+# 디지털 칭찬 상자: 기본 칭찬 문구 / 뽑기 (학생은 중복 등장하지 않음)
+import random
+from typing import Iterable, List, Optional, Tuple
+
+IDLE_DISPLAY = "PRESS ▶ TO REVEAL PRAISE"
+
+DEFAULT_COMPLIMENTS = [
+    "오늘도 최선을 다했어요! 멋져요!","어제보다 한 걸음 더 성장했네요 👏","도전하는 마음, 그 자체로 최고예요!",
+    "친구를 배려하는 모습이 정말 인상적이었어요 😊","실수는 배움의 시작! 아주 잘했어요!","집중력이 대단해요—계속 이렇게만 가자!",
+    "질문 덕분에 수업이 더 풍성해졌어요 💡","항상 웃는 얼굴로 수업에 참여해줘서 고마워요 😀","자신의 의견을 용기 있게 말한 점이 멋졌어요!",
+    "배운 내용을 친구에게 설명해주는 모습이 최고예요!","꾸준히 노력하는 모습이 감동이에요 ✨","책임감 있게 맡은 일을 끝내줘서 고마워요",
+    "새로운 아이디어를 제안해줘서 수업이 재미있었어요","어려운 문제를 끝까지 포기하지 않고 풀어냈군요!","다른 친구의 발표를 경청해줘서 고마워요",
+    "준비물을 꼼꼼히 챙겨오는 모습이 보기 좋아요","집중해서 필기하는 모습이 인상적이었어요","토론에서 근거를 들어 의견을 말하는 게 훌륭했어요",
+    "활발하게 참여해줘서 수업 분위기가 좋아졌어요","새로운 도전을 즐기는 용기가 멋져요","예의 바른 인사가 하루를 기분 좋게 만들었어요",
+    "친구를 격려하는 따뜻한 말 한마디가 최고예요","수업 준비를 미리 해오는 성실함이 돋보여요","책을 열심히 읽는 모습이 보기 좋았어요",
+    "협동심을 발휘해서 팀을 잘 이끌었어요","다른 친구의 실수를 이해해주는 마음이 아름다워요","조용히 하지만 꾸준히 노력하는 모습이 멋져요",
+    "정리정돈을 잘해줘서 교실이 깔끔해졌어요","수업 자료를 잘 찾아와서 도움이 많이 됐어요","배운 것을 생활 속에서 실천하는 모습이 훌륭해요",
+    "발표 때 목소리가 또렷하고 자신감 있었어요","작은 일에도 감사 인사를 해주는 마음이 예뻐요","수업 태도가 다른 친구들의 모범이 되고 있어요",
+    "몰입해서 과제를 하는 모습이 대단했어요","수업 시간에 눈빛이 반짝였어요 ✨","주어진 시간을 잘 지켜서 훌륭했어요","다양한 관점을 제시해줘서 수업이 풍성해졌어요"
+]
+
+def parse_lines(text: str) -> List[str]:
+    """쉼표 또는 줄바꿈으로 구분된 목록"""
+    return [x.strip() for x in text.replace(",", "\n").split("\n") if x.strip()]
+
+def remaining_students(students: List[str], picked: Iterable[str]) -> List[str]:
+    picked = set(picked)
+    return [s for s in students if s not in picked]
+
+def draw_praise(remaining: List[str], compliments: List[str], rng=random) -> Tuple[Optional[str], str]:
+    """남은 학생 1명(없으면 None) × 칭찬 문구 1개"""
+    student = rng.choice(remaining) if remaining else None
+    return student, rng.choice(compliments)
+
+def format_display(student: Optional[str], compliment: str) -> str:
+    return f"{student} 님!\n{compliment}" if student else compliment
+
+def draw_marathon(remaining: List[str], compliments: List[str], rng=random) -> List[Tuple[str, str]]:
+    """
+    칭찬 마라톤: 남은 학생 전원을 무작위 순서로 한 번에 뽑고 학생마다 문구를 짝지음
+    - 문구는 목록을 섞어 차례로 쓰고, 다 쓰면 다시 섞어서 이어감 (가능한 한 중복 없이)
+    """
+    order = list(remaining)
+    rng.shuffle(order)
+    phrases: List[str] = []
+    while compliments and len(phrases) < len(order):
+        batch = list(compliments)
+        rng.shuffle(batch)
+        phrases += batch
+    return list(zip(order, phrases))
@@ -0,0 +1,80 @@
+# retro_core/roulette.py
+# 역할 룰렛: 한 번씩 뽑기 / 여러 팀 일괄 배정 (역할 정원)
+import random
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+
+DEFAULT_ROLES = ["팀장","서기","자료 조사","발표자","시간 관리","정리 담당"]
+
+def parse_list(text: str) -> List[str]:
+    """쉼표/줄바꿈으로 구분된 목록"""
+    return [x.strip() for x in text.replace("\n", ",").split(",") if x.strip()]
+
+def spin(students: List[str], roles: List[str], assignments: List[Dict], rng=random) -> Tuple[Optional[str], Optional[str]]:
+    """
+    아직 배정되지 않은 학생 1명 × 역할 1개를 뽑습니다.
+    남은 학생이 없으면 (None, None), 남은 역할이 없으면 (학생, None)
+    """
+    taken_students = {a["학생"] for a in assignments}
+    taken_roles = {a["역할"] for a in assignments}
+    unassigned_students = [s for s in students if s not in taken_students]
+    unassigned_roles = [r for r in roles if r not in taken_roles]
+    if not unassigned_students: return None, None
+    if not unassigned_roles: return unassigned_students[0], None
+    return rng.choice(unassigned_students), rng.choice(unassigned_roles)
+
+def parse_role_caps(text: str):
+    """'팀장, 자료 조사:2, 발표자*2' → [("팀장",1), ("자료 조사",2), ("발표자",2)] (목록 순서 = 우선순위)"""
+    caps = []
+    for item in text.replace("\n", ",").split(","):
+        item = item.strip()
+        if not item: continue
+        name, cap = item, 1
+        for sep in (":", "*", "×"):
+            if sep in item:
+                head, _, tail = item.rpartition(sep)
+                if tail.strip().isdigit():
+                    name, cap = head.strip(), int(tail.strip())
+                break
+        if name and cap > 0: caps.append((name, cap))
+    return caps
+
+NAME_COLS = ("name", "이름", "학생", "성명")
+TEAM_COLS = ("group", "team", "조", "팀", "모둠")
+
+def parse_team_csv(file) -> pd.DataFrame:
+    """
+    CSV: 이름, 팀 두 열 → 학생/팀 표
+    - 헤더: name/이름/학생/성명 + group/team/조/팀/모둠 (없으면 앞의 두 열 사용)
+    - 열이 하나뿐이거나 헤더에 팀 열이 없으면 ValueError (화면에서 경고로 보여 줌)
+    """
+    df = pd.read_csv(file)
+    cols = [str(c).strip().lower() for c in df.columns]
+    name_key = next((k for k in NAME_COLS if k in cols), None)
+    team_key = next((k for k in TEAM_COLS if k in cols), None)
+    if name_key and team_key:
+        name_col, team_col = df.columns[cols.index(name_key)], df.columns[cols.index(team_key)]
+    elif name_key or team_key:
+        raise ValueError(f"팀 CSV 헤더에 {'팀(조)' if name_key else '이름'} 열이 없습니다. (예: 이름,조)")
+    else:
+        file.seek(0)
+        df = pd.read_csv(file, header=None)
+        if df.shape[1] < 2: raise ValueError("팀 CSV에는 이름과 팀(조) 두 열이 필요합니다. (예: 이름,조)")
+        name_col, team_col = df.columns[0], df.columns[1]
+    out = pd.DataFrame({"학생": df[name_col].fillna("").astype(str).str.strip(), "팀": df[team_col]})
+    return out[(out["학생"] != "") & out["팀"].notna()].reset_index(drop=True)
+
+def batch_assign(members: pd.DataFrame, role_caps, seed=None) -> pd.DataFrame:
+    """
+    모든 팀에 역할을 한 번에 배정합니다. (룰렛을 여러 번 돌리지 않음)
+    - 전체 학생을 한 번 섞은 뒤 팀 안 순번(cumcount)을 역할 슬롯에 그대로 대응
+    - 역할마다 정원(capacity)까지만 배정, 슬롯보다 인원이 많으면 나머지는 '팀원'
+    - 인원이 모자라면 목록 뒤쪽 역할부터 비어 있음
+    - seed가 같으면 결과도 같음
+    """
+    rng = random.Random(seed)
+    slots = pd.Series([role for role, cap in role_caps for _ in range(cap)], dtype=object)
+    df = members.sample(frac=1, random_state=rng.randrange(2**32)).reset_index(drop=True)
+    df["순번"] = df.groupby("팀", sort=False).cumcount()
+    df["역할"] = df["순번"].map(slots).fillna("팀원")
+    return df.sort_values(["팀", "순번"], kind="stable").drop(columns="순번").reset_index(drop=True)
@@ -0,0 +1,97 @@
+# retro_core/seat_rules.py
+# 자리 규칙 점검: 같은 조 / 떨어뜨릴 학생 / 같은 성별 짝이 붙어 앉았는지 실시간 표시
+# - 격자의 이웃 목록(좌우 = 짝, 앞뒤)을 한 번 만들어 두고
+# - 교환·잠금 변경 때는 바뀐 칸의 이웃만 다시 봄 → 칸당 O(이웃 수), 격자 크기와 무관
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from retro_core.seating import is_real
+
+Cell = Tuple[int, int]
+Edge = Tuple[Cell, Cell]
+
+RULES = ("group", "apart", "gender")
+RULE_LABELS = {"group": "같은 조", "apart": "떨어뜨리기", "gender": "같은 성별 짝"}
+
+def neighbour_index(rows: int, cols: int) -> Dict[Cell, List[Tuple[Cell, bool]]]:
+    """칸 → [(이웃 칸, 좌우 여부)] (좌우 = 짝, 앞뒤 = 세로 이웃)"""
+    nbrs: Dict[Cell, List[Tuple[Cell, bool]]] = {}
+    for i in range(rows):
+        for j in range(cols):
+            lst = []
+            if j > 0: lst.append(((i, j-1), True))
+            if j < cols-1: lst.append(((i, j+1), True))
+            if i > 0: lst.append(((i-1, j), False))
+            if i < rows-1: lst.append(((i+1, j), False))
+            nbrs[(i, j)] = lst
+    return nbrs
+
+def parse_apart(text: str) -> Set[FrozenSet[str]]:
+    """한 줄에 한 쌍: '홍길동-김철수' 또는 '홍길동, 김철수'"""
+    pairs = set()
+    for line in text.splitlines():
+        names = [x.strip() for x in re.split(r"[-,/]", line) if x.strip()]
+        if len(names) == 2 and names[0] != names[1]:
+            pairs.add(frozenset(names))
+    return pairs
+
+def pair_reasons(p: Optional[Dict], q: Optional[Dict], horizontal: bool,
+                 apart: Set[FrozenSet[str]], rules: Set[str]) -> Tuple[str, ...]:
+    """두 이웃 좌석이 어기는 규칙들 (없으면 빈 튜플)"""
+    if not (is_real(p) and is_real(q)): return ()
+    reasons = []
+    if "group" in rules and p.get("group") is not None and p.get("group") == q.get("group"):
+        reasons.append("group")
+    if "apart" in rules and frozenset((p["name"], q["name"])) in apart:
+        reasons.append("apart")
+    if "gender" in rules and horizontal and p.get("gender") and p.get("gender") == q.get("gender"):
+        reasons.append("gender")
+    return tuple(reasons)
+
+class ConflictTracker:
+    """
+    좌석 격자의 규칙 위반 쌍을 들고 있다가, 바뀐 칸의 이웃만 다시 계산합니다.
+    - edges: {(칸a, 칸b): (규칙, ...)}  위반 쌍만 저장
+    - count: 위반 쌍 수 (증감으로 유지)
+    """
+    def __init__(self, rows: int, cols: int, apart: Iterable[FrozenSet[str]] = (), rules: Iterable[str] = RULES):
+        self.shape = (rows, cols)
+        self.nbrs = neighbour_index(rows, cols)
+        self.apart = set(apart)
+        self.rules = set(rules)
+        self.edges: Dict[Edge, Tuple[str, ...]] = {}
+        self.count = 0
+
+    def _check(self, seats, a: Cell, b: Cell, horizontal: bool):
+        key = (a, b) if a < b else (b, a)
+        reasons = pair_reasons(seats[a[0]][a[1]], seats[b[0]][b[1]], horizontal, self.apart, self.rules)
+        had = key in self.edges
+        if reasons:
+            self.edges[key] = reasons
+            if not had: self.count += 1
+        elif had:
+            del self.edges[key]
+            self.count -= 1
+
+    def rebuild(self, seats):
+        """전체 격자를 처음부터 점검 (셔플·크기 변경·규칙 변경 때)"""
+        self.edges.clear(); self.count = 0
+        for a, lst in self.nbrs.items():
+            for b, horizontal in lst:
+                if a < b: self._check(seats, a, b, horizontal)
+        return self
+
+    def update(self, seats, cells: Iterable[Cell]):
+        """바뀐 칸(교환한 두 칸, 잠금을 바꾼 칸 등)의 이웃 쌍만 다시 점검"""
+        for a in set(cells):
+            for b, horizontal in self.nbrs.get(a, ()):
+                self._check(seats, a, b, horizontal)
+        return self
+
+    def cell_reasons(self) -> Dict[Cell, Set[str]]:
+        """칸 → 걸린 규칙들 (화면 오버레이용, 위반 쌍 수에 비례)"""
+        out: Dict[Cell, Set[str]] = {}
+        for (a, b), reasons in self.edges.items():
+            out.setdefault(a, set()).update(reasons)
+            out.setdefault(b, set()).update(reasons)
+        return out
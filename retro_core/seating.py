@@ -0,0 +1,222 @@
+# retro_core/seating.py
+# 자리 랜덤 배치 로직 (명단 파싱 / 셔플 / 교환 / CSV·PNG 내보내기)
+# 좌석 격자는 seats[i][j] = {name, gender, group} 또는 None, locked[i][j] = bool 인 리스트의 리스트
+import random, itertools, io, re
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+import pandas as pd
+from PIL import Image, ImageDraw, ImageFont
+
+from retro_core.fonts import font_data, resolve
+
+Person = Dict
+Grid = List[List[Optional[Person]]]
+EMPTY_SEAT = {"name": "빈자리", "gender": None, "group": None}
+
+def empty_grid(rows: int, cols: int, fill=None) -> list:
+    return [[fill for _ in range(cols)] for __ in range(rows)]
+
+def resize_grid(seats: Grid, locked: List[List[bool]], r: int, c: int) -> Tuple[Grid, List[List[bool]]]:
+    """행·열이 바뀌면 겹치는 영역의 좌석/잠금만 유지한 새 격자를 돌려줌"""
+    old_r, old_c = len(seats), len(seats[0]) if seats else 0
+    new_seats = empty_grid(r, c)
+    new_lock  = empty_grid(r, c, False)
+    for i in range(min(r, old_r)):
+        for j in range(min(c, old_c)):
+            new_seats[i][j] = seats[i][j]
+            new_lock[i][j]  = locked[i][j]
+    return new_seats, new_lock
+
+def normalize_gender(g: Optional[str]) -> Optional[str]:
+    if not g: return None
+    g = str(g).strip().lower()
+    if g in ["m", "male", "남", "남자", "boy"]: return "M"
+    if g in ["f", "female", "여", "여자", "girl"]: return "F"
+    return None
+
+def parse_text_lines(text: str) -> List[Dict]:
+    """이름[,성별][,조] / 괄호표기(홍길동(남) 2) 등 다양한 라인 파싱"""
+    people = []
+    for line in text.splitlines():
+        s = line.strip()
+        if not s: continue
+        name, gender, group = s, None, None
+        m = re.search(r"[([]\s*([mfMF남여男女])\s*[])]", s)
+        if m: gender = m.group(1)
+        m2 = re.search(r"(\d+)\s*$", s)
+        if m2: group = int(m2.group(1))
+        parts = [p.strip() for p in re.split(r"[,\t]", s)]
+        if len(parts) >= 1: name = parts[0] or name
+        if len(parts) >= 2: gender = parts[1] or gender
+        if len(parts) >= 3 and parts[2].isdigit(): group = int(parts[2])
+        people.append({"name": name, "gender": normalize_gender(gender), "group": group})
+    return people
+
+def parse_uploaded(file) -> List[Dict]:
+    """CSV: name[, gender][, group] (헤더 없어도 동작)"""
+    try:
+        df = pd.read_csv(file)
+    except Exception:
+        file.seek(0)
+        df = pd.read_csv(file, header=None)
+        if df.shape[1] == 1:
+            df.columns = ["name"]
+    cols = [str(c).lower() for c in df.columns]
+    col_map = {}
+    for key in ["name", "gender", "group"]:
+        if key in cols: col_map[key] = df.columns[cols.index(key)]
+    people = []
+    for _, row in df.iterrows():
+        name = str(row.get(col_map.get("name", "name"), row.get(0, ""))).strip()
+        if not name: continue
+        gender = normalize_gender(row.get(col_map.get("gender", "gender"), None))
+        group = row.get(col_map.get("group", "group"), None)
+        try: group = int(group) if pd.notna(group) else None
+        except Exception: group = None
+        people.append({"name": name, "gender": gender, "group": group})
+    return people
+
+def flat_positions(rows, cols): return list(itertools.product(range(rows), range(cols)))
+
+def shuffle_seats(seats: Grid, locked: List[List[bool]], people: List[Person], seed=None) -> Grid:
+    """
+    잠기지 않은 좌석을 셔플합니다. (seats를 그대로 수정하고 돌려줌)
+    - seed가 None이면 실행 때마다 다른 배치
+    - seed(숫자/문자)를 주면 항상 같은 결과 → '재현' 가능
+    - 명단이 모자라면 '빈자리'로 채우고, 넘치면 앞에서부터 자름
+    """
+    rng = random.Random(seed)
+    rows, cols = len(seats), len(seats[0]) if seats else 0
+    targets = [(i,j) for i,j in flat_positions(rows, cols) if not locked[i][j]]
+    pool = people.copy()
+    need = len(targets)
+    if len(pool) < need:
+        pool = pool + [dict(EMPTY_SEAT) for _ in range(need - len(pool))]
+    else:
+        pool = pool[:need]
+    rng.shuffle(pool)
+    for (i,j), person in zip(targets, pool):
+        seats[i][j] = person
+    return seats
+
+def is_real(person: Optional[Person]) -> bool:
+    return bool(person) and bool(person.get("name")) and person.get("name") != EMPTY_SEAT["name"]
+
+def _keyed(names) -> List[Tuple[str, int]]:
+    """같은 이름은 (이름, 몇 번째) 로 구분 → 동명이인이 한 명으로 합쳐지지 않음"""
+    seen: Dict[str, int] = {}
+    keys = []
+    for n in names:
+        k = seen.get(n, 0); seen[n] = k + 1
+        keys.append((n, k))
+    return keys
+
+def reseat(seats: Grid, locked: List[List[bool]], people: List[Person], seed=None, compact: bool = False) -> Dict:
+    """
+    명단이 바뀌었을 때 최소 이동으로 다시 앉힙니다. (seats를 그대로 수정)
+    - 계속 다니는 학생은 제자리 (정보만 새 명단 것으로 갱신)
+    - 나간 학생 자리는 '빈자리'로 비움 (잠긴 자리여도 비우지만, 새 학생을 앉히지는 않음)
+    - 새 학생은 seed로 섞은 순서대로 앞쪽 빈자리부터 채움 → 기존 학생 이동 0
+    - compact=True면 남은 빈자리를 맨 뒤 학생부터 당겨 채움 (빈자리 하나당 이동 1번)
+    - 동명이인은 (이름, 몇 번째) 로 맞춤: 명단에서 k번째 '김민준' = 격자를 행 순서로 훑어 k번째 '김민준'
+    격자 색인은 한 번만 훑고, 이후 작업은 바뀐 인원 수에 비례
+    반환: {"kept", "removed", "added", "moved", "unseated", "duplicates"} (removed/added/unseated는 이름 목록)
+    """
+    rng = random.Random(seed)
+    rows, cols = len(seats), len(seats[0]) if seats else 0
+    cells: List[Tuple[int, int]] = []
+    free: List[Tuple[int, int]] = []
+    for i in range(rows):
+        for j in range(cols):
+            if is_real(seats[i][j]): cells.append((i, j))
+            elif not locked[i][j]: free.append((i, j))
+    where: Dict[Tuple[str, int], Tuple[int, int]] = dict(zip(_keyed(seats[i][j]["name"] for i, j in cells), cells))
+
+    listed = [p for p in people if p.get("name")]
+    roster = dict(zip(_keyed(p["name"] for p in listed), listed))
+    duplicates = sorted({n for n, k in itertools.chain(roster, where) if k})
+    removed = [key for key in where if key not in roster]
+    added = [key for key in roster if key not in where]
+    for key in removed:
+        i, j = where.pop(key)
+        seats[i][j] = dict(EMPTY_SEAT)
+        if not locked[i][j]: free.append((i, j))
+    for key, (i, j) in where.items():
+        seats[i][j] = roster[key]
+    free.sort()
+
+    rng.shuffle(added)
+    placed = min(len(added), len(free))
+    for key, (i, j) in zip(added, free):
+        seats[i][j] = roster[key]
+    free = free[placed:]
+
+    moved = 0
+    if compact and free:
+        # 빈자리보다 뒤에 앉은 (잠기지 않은) 학생을 맨 뒤부터 앞 빈자리로
+        back = sorted((cell for cell in where.values() if not locked[cell[0]][cell[1]]), reverse=True)
+        for gap in free:
+            if not back or back[0] < gap: break
+            src = back.pop(0)
+            seats[gap[0]][gap[1]], seats[src[0]][src[1]] = seats[src[0]][src[1]], dict(EMPTY_SEAT)
+            moved += 1
+    return {"kept": len(where), "removed": [n for n, _ in removed], "added": [n for n, _ in added[:placed]],
+            "moved": moved, "unseated": [n for n, _ in added[placed:]], "duplicates": duplicates}
+
+def swap(seats: Grid, a, b):
+    (i1,j1),(i2,j2) = a,b
+    seats[i1][j1], seats[i2][j2] = seats[i2][j2], seats[i1][j1]
+
+def seats_to_dataframe(seats: Grid) -> pd.DataFrame:
+    data = []
+    for i,row in enumerate(seats, start=1):
+        for j,person in enumerate(row, start=1):
+            if person is None: person = {"name":"", "gender":None, "group":None}
+            data.append({"row":i, "col":j, **person})
+    return pd.DataFrame(data)
+
+def fill_color(g):
+    if g == "M": return (31,59,104)
+    if g == "F": return (90,47,79)
+    return (37,50,71)
+
+@lru_cache(maxsize=2)
+def load_fonts(font_key: Optional[str] = None):
+    """(이름 폰트, 조 배지 폰트) — retro_core.fonts에 등록한 폰트의 키로, 프로세스에서 한 번만 파싱"""
+    font = None; badge_font = None
+    data = font_data(font_key)
+    try:
+        if data:
+            font = ImageFont.truetype(io.BytesIO(data), 22)
+            badge_font = ImageFont.truetype(io.BytesIO(data), 16)
+    except Exception:
+        font = None
+    if font is None: font = ImageFont.load_default()
+    if badge_font is None: badge_font = font
+    return font, badge_font
+
+def render_png(seats: Grid, font_bytes: Optional[bytes]=None, cell=(240,130), margin=24, font_key: Optional[str]=None) -> bytes:
+    rows, cols = len(seats), len(seats[0]) if seats else 0
+    cw, ch = cell
+    w, h = cols*cw + margin*2, rows*ch + margin*2
+    img = Image.new("RGB", (w, h), (15,23,42))
+    draw = ImageDraw.Draw(img)
+    font, badge_font = load_fonts(resolve(font_bytes, font_key))
+
+    for i in range(rows):
+        for j in range(cols):
+            x0, y0 = margin + j*cw, margin + i*ch
+            person = seats[i][j]
+            name  = (person or {}).get("name","")
+            gender= (person or {}).get("gender",None)
+            group = (person or {}).get("group",None)
+            draw.rounded_rectangle([x0, y0, x0+cw-1, y0+ch-1], radius=18,
+                                   fill=fill_color(gender), outline=(56,189,248), width=3)
+            if group:
+                bx0, by0 = x0+10, y0+8
+                draw.rounded_rectangle([bx0,by0,bx0+42,by0+24], radius=8,
+                                       outline=(148,163,184), width=1, fill=(2,6,23))
+                draw.text((bx0+10,by0+6), str(group), fill=(226,232,240), font=badge_font)
+            if name:
+                draw.text((x0 + 20, y0 + (ch - 20)/2), name, fill=(226,232,240), font=font)
+    buf = io.BytesIO(); img.save(buf, format="PNG"); return buf.getvalue()
@@ -0,0 +1,160 @@
+# retro_core/serve.py
+# 여러 코어 쓰기: Streamlit worker 여러 개 + 앞단 로컬 리버스 프록시(세션 고정) 를 한 번에 띄우는 런처
+#
+#   python -m retro_core.serve --workers 4 --port 8501
+#
+# - worker k 는 127.0.0.1:(base_port + k) 에서 독립 프로세스로 실행 → 한 교실의 무거운 작업이 다른 교실을 막지 않음
+# - 프록시는 첫 응답에 retro_worker 쿠키를 붙이고, 이후 요청(웹소켓 포함)은 같은 worker로 보냄
+#   세션 상태·업로드·미디어 파일은 worker 메모리에 있으므로 세션 고정이 필요
+# - 새 브라우저는 열린 연결이 가장 적은 worker로, 그 worker가 죽었으면 다음 worker로 넘김
+# - 모든 worker는 같은 RETRO_STORE(공유 저장소)와 같은 쿠키 비밀값(STREAMLIT_SERVER_COOKIE_SECRET)을 받음
+import argparse, asyncio, os, re, secrets, signal, subprocess, sys, time, urllib.request
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+COOKIE = "retro_worker"
+COOKIE_RE = re.compile(rb"^cookie:.*\b" + COOKIE.encode() + rb"=(\d+)", re.I | re.M)
+HEAD_LIMIT = 64 * 1024
+
+# ============================ Workers ============================
+def start_workers(n: int, base_port: int, store: Path, app: Path = ROOT / "streamlit_app.py") -> List[subprocess.Popen]:
+    env = dict(os.environ, RETRO_STORE=str(store), STREAMLIT_SERVER_COOKIE_SECRET=secrets.token_hex(16),
+               PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    procs = []
+    for k in range(n):
+        cmd = [sys.executable, "-m", "retro_core.warmup", str(app),     # streamlit run + 시작 시 캐시 워밍업
+               "--server.port", str(base_port + k), "--server.address", "127.0.0.1",
+               "--server.headless", "true", "--browser.gatherUsageStats", "false"]
+        procs.append(subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL))   # 오류(stderr)는 그대로 보이게
+    return procs
+
+def wait_healthy(ports: List[int], procs: List[subprocess.Popen], timeout: float = 60) -> bool:
+    deadline = time.monotonic() + timeout
+    pending = set(ports)
+    while pending and time.monotonic() < deadline:
+        if any(p.poll() is not None for p in procs): return False
+        for p in list(pending):
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{p}/_stcore/health", timeout=1) as r:
+                    if r.status == 200: pending.discard(p)
+            except OSError:
+                pass
+        if pending: time.sleep(0.3)
+    return not pending
+
+def stop_workers(procs: List[subprocess.Popen]):
+    for p in procs:
+        if p.poll() is None: p.terminate()
+    for p in procs:
+        try: p.wait(timeout=10)
+        except subprocess.TimeoutExpired: p.kill()
+
+# ============================ Sticky proxy ============================
+class StickyProxy:
+    """HTTP/웹소켓을 그대로 중계하는 TCP 프록시. 요청 머리만 읽어 worker를 고르고 나머지는 바이트 복사"""
+    def __init__(self, ports: List[int], host: str = "127.0.0.1"):
+        self.ports, self.host = ports, host
+        self.active = [0] * len(ports)
+
+    def choose(self, head: bytes) -> Tuple[int, bool]:
+        """(worker 번호, 쿠키로 정해졌는지)"""
+        m = COOKIE_RE.search(head)
+        if m and int(m.group(1)) < len(self.ports): return int(m.group(1)), True
+        return min(range(len(self.ports)), key=self.active.__getitem__), False
+
+    async def connect(self, k: int):
+        """k번 worker에 연결, 실패하면 다음 worker로 (반환: 실제 번호, reader, writer)"""
+        n = len(self.ports)
+        for step in range(n):
+            kk = (k + step) % n
+            try:
+                r, w = await asyncio.open_connection(self.host, self.ports[kk])
+                return kk, r, w
+            except OSError:
+                continue
+        raise ConnectionError("살아 있는 worker가 없습니다")
+
+    async def handle(self, creader: asyncio.StreamReader, cwriter: asyncio.StreamWriter):
+        try:
+            head = await creader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            cwriter.close(); return
+        k, sticky = self.choose(head)
+        try:
+            got, breader, bwriter = await self.connect(k)
+        except ConnectionError:
+            cwriter.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await cwriter.drain(); cwriter.close(); return
+        self.active[got] += 1
+        try:
+            bwriter.write(head)
+            up = asyncio.create_task(self.pipe(creader, bwriter))
+            if not sticky or got != k:
+                # 첫 응답 머리에 쿠키를 끼워 넣고 나머지는 그대로
+                rhead = await breader.readuntil(b"\r\n\r\n")
+                cookie = f"Set-Cookie: {COOKIE}={got}; Path=/; HttpOnly; SameSite=Lax\r\n".encode()
+                cwriter.write(rhead[:-2] + cookie + b"\r\n")
+            await self.pipe(breader, cwriter)
+            up.cancel()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            self.active[got] -= 1
+            for w in (bwriter, cwriter):
+                try: w.close()
+                except Exception: pass
+
+    @staticmethod
+    async def pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data: break
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            try: writer.write_eof()
+            except Exception: pass
+
+    async def serve(self, port: int, address: str = "0.0.0.0"):
+        server = await asyncio.start_server(self.handle, address, port, limit=HEAD_LIMIT)
+        async with server:
+            await server.serve_forever()
+
+# ============================ Launcher ============================
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m retro_core.serve", description="레트로 학급 도구 다중 worker 실행")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="worker 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--port", type=int, default=8501, help="접속 포트 (기본: 8501)")
+    parser.add_argument("--address", default="0.0.0.0", help="접속 주소 (기본: 0.0.0.0)")
+    parser.add_argument("--base-port", type=int, default=8600, help="worker 포트 시작 번호 (기본: 8600)")
+    parser.add_argument("--store", type=Path, default=None, help="공유 저장소 파일 (기본: RETRO_STORE 또는 ~/.retro_class_tools/store.sqlite3)")
+    return parser
+
+def _interrupt(*_):
+    raise KeyboardInterrupt
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    from retro_core.store import Store
+    store = Store(args.store).path     # 여기서 한 번 만들어 두면 worker들은 열기만 함
+    ports = [args.base_port + k for k in range(max(1, args.workers))]
+    procs = start_workers(len(ports), args.base_port, store)
+    try:
+        if not wait_healthy(ports, procs):
+            print("worker가 시작되지 않았습니다.", file=sys.stderr)
+            return 1
+        print(f"worker {len(ports)}개 ({ports[0]}~{ports[-1]}) → http://{args.address}:{args.port}  (저장소: {store})", flush=True)
+        signal.signal(signal.SIGTERM, _interrupt)
+        asyncio.run(StickyProxy(ports).serve(args.port, args.address))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_workers(procs)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
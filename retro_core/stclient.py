@@ -0,0 +1,103 @@
+# retro_core/stclient.py
+# 브라우저 없이 Streamlit 세션 하나를 여는 최소 클라이언트 (표준 라이브러리 + streamlit 메시지 정의)
+# - /_stcore/stream 웹소켓에 재실행 요청(BackMsg)을 보내고 script_finished(ForwardMsg)까지 기다림
+# - 부하 측정·클릭별 실행 시간(loadtest)과 서버 시작 때 페이지 미리 실행(warmup)에서 씀
+import asyncio, base64, os, struct
+from typing import Dict, NamedTuple, Optional
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+PAGES = ("", "학습성향_MBTI", "역할_룰렛", "디지털_칭찬_상자", "레트로_발표_타이머", "레트로_자리_랜덤_배치")   # "" = 홈
+
+class WebSocket:
+    """RFC 6455 클라이언트 (바이너리 메시지만, 압축 확장 없음)"""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader, self.writer = reader, writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int, path: str = "/_stcore/stream") -> "WebSocket":
+        reader, writer = await asyncio.open_connection(host, port, limit=2**24)
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\nSec-WebSocket-Protocol: streamlit\r\n\r\n").encode())
+        head = await reader.readuntil(b"\r\n\r\n")
+        if b" 101 " not in head.split(b"\r\n", 1)[0]:
+            raise ConnectionError(head.split(b"\r\n", 1)[0].decode(errors="replace"))
+        return cls(reader, writer)
+
+    async def send(self, payload: bytes, opcode: int = 0x2):
+        n = len(payload)
+        if n < 126: head = struct.pack("!BB", 0x80 | opcode, 0x80 | n)
+        elif n < 1 << 16: head = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, n)
+        else: head = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, n)
+        mask = os.urandom(4)
+        masked = (int.from_bytes(payload, "big") ^ int.from_bytes((mask * (n // 4 + 1))[:n], "big")).to_bytes(n, "big") if n else b""
+        self.writer.write(head + mask + masked)
+        await self.writer.drain()
+
+    async def recv(self) -> bytes:
+        parts = []
+        while True:
+            b1, b2 = await self.reader.readexactly(2)
+            n = b2 & 0x7F
+            if n == 126: n = struct.unpack("!H", await self.reader.readexactly(2))[0]
+            elif n == 127: n = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+            data = await self.reader.readexactly(n)
+            opcode = b1 & 0x0F
+            if opcode == 0x8: raise ConnectionError("웹소켓이 닫혔습니다")
+            if opcode == 0x9: await self.send(data, 0xA); continue   # ping → pong
+            if opcode == 0xA: continue
+            parts.append(data)
+            if b1 & 0x80: return b"".join(parts)
+
+    def close(self):
+        self.writer.close()
+
+class Widget(NamedTuple):
+    id: str
+    kind: str          # "button", "text_area", ...
+    label: str
+    fragment: str      # 이 위젯이 속한 st.fragment id ("" = 페이지 전체)
+
+def widget_name(el_id: str, label: str) -> str:
+    """key를 준 위젯은 key, 아니면 라벨 (위젯 id = "$$ID-<해시>-<key 또는 None>")"""
+    key = el_id.rsplit("-", 1)[-1]
+    return label if key == "None" else key
+
+async def interact(ws: WebSocket, page: str, trigger: Optional[Widget] = None,
+                   values: Optional[Dict[str, str]] = None) -> Dict[str, Widget]:
+    """
+    재실행 요청을 보내고 끝날 때까지 기다림 → 화면의 위젯 {이름: Widget}
+    - trigger: 누를 버튼. 조각(fragment) 안의 버튼이면 브라우저처럼 그 조각만 다시 실행하도록 요청
+    - values: {위젯 id: 문자열 값} (text_area/text_input)
+    """
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_name = page
+    for wid, value in (values or {}).items():
+        w = msg.rerun_script.widget_states.widgets.add()
+        w.id, w.string_value = wid, value
+    if trigger:
+        w = msg.rerun_script.widget_states.widgets.add()
+        w.id, w.trigger_value = trigger.id, True
+        msg.rerun_script.fragment_id = trigger.fragment
+    await ws.send(msg.SerializeToString())
+    widgets = {}
+    while True:
+        fm = ForwardMsg()
+        fm.ParseFromString(await ws.recv())
+        kind = fm.WhichOneof("type")
+        if kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+            el = fm.delta.new_element
+            ek = el.WhichOneof("type")
+            inner = getattr(el, ek) if ek else None
+            el_id, label = getattr(inner, "id", ""), getattr(inner, "label", "")
+            if el_id: widgets[widget_name(el_id, label)] = Widget(el_id, ek, label, fm.delta.fragment_id)
+        elif kind == "script_finished" and fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+            return widgets      # st.rerun()으로 끊긴 실행은 이어지는 재실행까지 기다림
+
+async def run_script(ws: WebSocket, page: str, trigger: Optional[str] = None) -> Dict[str, str]:
+    """재실행 요청(버튼 id로 누르기)을 보내고 끝날 때까지 기다림 → 화면의 버튼 {라벨: 위젯 id}"""
+    widgets = await interact(ws, page, Widget(trigger, "button", "", "") if trigger else None)
+    return {w.label: w.id for w in widgets.values() if w.kind == "button"}
@@ -0,0 +1,42 @@
+# retro_core/store.py
+# 작업 프로세스(worker) 여러 개가 함께 쓰는 로컬 저장소 (SQLite 파일 하나, 표준 라이브러리만 사용)
+# - 세션 상태(st.session_state)는 프로세스 안에만 있으므로, 다른 기기·다른 worker에서도 봐야 하는 것
+#   (예: 반 명단)은 여기에 '이름공간/키 → JSON'으로 저장
+# - WAL 모드라 읽기는 서로 막지 않고, 쓰기는 짧은 트랜잭션 하나씩
+# - 경로: 환경 변수 RETRO_STORE (serve 런처가 모든 worker에 같은 값을 넘김), 없으면 ~/.retro_class_tools/store.sqlite3
+import json, os, sqlite3, time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, List, Optional
+
+DEFAULT_PATH = Path.home() / ".retro_class_tools" / "store.sqlite3"
+
+class Store:
+    def __init__(self, path: Optional[os.PathLike] = None):
+        self.path = Path(path or os.environ.get("RETRO_STORE") or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as con, con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("CREATE TABLE IF NOT EXISTS kv (ns TEXT, key TEXT, value TEXT, updated REAL, PRIMARY KEY (ns, key))")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def put(self, ns: str, key: str, value: Any):
+        with closing(self._connect()) as con, con:
+            con.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?, ?)",
+                        (ns, key, json.dumps(value, ensure_ascii=False), time.time()))
+
+    def get(self, ns: str, key: str, default: Any = None) -> Any:
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT value FROM kv WHERE ns = ? AND key = ?", (ns, key)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def keys(self, ns: str) -> List[str]:
+        """이름공간의 키 목록 (최근에 저장한 것부터)"""
+        with closing(self._connect()) as con:
+            return [r[0] for r in con.execute("SELECT key FROM kv WHERE ns = ? ORDER BY updated DESC", (ns,))]
+
+    def delete(self, ns: str, key: str):
+        with closing(self._connect()) as con, con:
+            con.execute("DELETE FROM kv WHERE ns = ? AND key = ?", (ns, key))
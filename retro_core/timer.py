@@ -0,0 +1,143 @@
+# retro_core/timer.py
+# 발표 진행표(agenda): 발표자 전체 일정을 한 번에 계산해 두고 단조 시계(time.monotonic) 기준으로 진행
+# - 시각은 '시작 후 경과 초'로만 다루므로 NTP 보정 등 벽시계 변경에 영향 없음
+# - 일시정지/재개는 shift 하나만 바꿈 → 남은 일정 전체가 O(1)로 밀림
+# - 현재 구간 찾기는 누적 종료 시각에 대한 이분 탐색 O(log n)
+import json, time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+TALK, GAP = "talk", "gap"
+
+@dataclass
+class Agenda:
+    segments: List[Dict]                       # {"name", "kind", "start", "end"} (시작 기준 초)
+    ends: List[float] = field(default_factory=list)
+    started_at: Optional[float] = None         # time.monotonic() 기준 시작 시각
+    shift: float = 0.0                         # 일시정지·건너뛰기로 밀린 초 (음수 = 앞당김)
+    paused_at: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        return self.ends[-1] if self.ends else 0.0
+
+def parse_agenda(text: str, default_min: float = 3) -> List[Tuple[str, float]]:
+    """한 줄에 발표자 하나: '이름[, 분]' (분 생략 시 default_min)"""
+    items = []
+    for line in text.splitlines():
+        parts = [p.strip() for p in line.split(",")]
+        if not parts[0]: continue
+        try: mins = float(parts[1]) if len(parts) > 1 and parts[1] else default_min
+        except ValueError: mins = default_min
+        if mins > 0: items.append((parts[0], mins * 60))
+    return items
+
+def build_agenda(items: List[Tuple[str, float]], gap_sec: float = 0) -> Agenda:
+    """발표자 목록 → 발표/교대 구간이 이어진 일정 (마지막 발표 뒤에는 교대 없음)"""
+    segments, t = [], 0.0
+    for k, (name, dur) in enumerate(items):
+        segments.append({"name": name, "kind": TALK, "start": t, "end": t + dur}); t += dur
+        if gap_sec > 0 and k < len(items) - 1:
+            nxt = items[k + 1][0]
+            segments.append({"name": nxt, "kind": GAP, "start": t, "end": t + gap_sec}); t += gap_sec
+    return Agenda(segments=segments, ends=[s["end"] for s in segments])
+
+def elapsed(ag: Agenda, now: Optional[float] = None) -> float:
+    """일정 기준 경과 초 (일시정지 중이면 멈춘 시점 값)"""
+    if ag.started_at is None: return 0.0
+    if ag.paused_at is not None: now = ag.paused_at
+    elif now is None: now = time.monotonic()
+    return min(ag.total, max(0.0, now - ag.started_at - ag.shift))
+
+def start(ag: Agenda, now: Optional[float] = None):
+    ag.started_at = time.monotonic() if now is None else now
+    ag.shift, ag.paused_at = 0.0, None
+
+def pause(ag: Agenda, now: Optional[float] = None):
+    if ag.started_at is not None and ag.paused_at is None:
+        ag.paused_at = time.monotonic() if now is None else now
+
+def resume(ag: Agenda, now: Optional[float] = None):
+    if ag.paused_at is not None:
+        ag.shift += (time.monotonic() if now is None else now) - ag.paused_at
+        ag.paused_at = None
+
+def reset(ag: Agenda):
+    """시작 전 상태로 (일정은 그대로)"""
+    ag.started_at, ag.shift, ag.paused_at = None, 0.0, None
+
+def skip(ag: Agenda, now: Optional[float] = None):
+    """현재 구간을 바로 끝내고 다음 구간으로 (남은 시간만큼 일정을 앞당김, 일시정지 중이면 멈춘 채 이동)"""
+    cur = current(ag, now)
+    if cur is not None:
+        ag.shift -= cur[2]
+
+def current(ag: Agenda, now: Optional[float] = None) -> Optional[Tuple[int, Dict, float]]:
+    """(구간 번호, 구간, 남은 초) — 일정이 모두 끝났으면 None"""
+    t = elapsed(ag, now)
+    k = bisect_right(ag.ends, t)
+    if k >= len(ag.segments): return None
+    return k, ag.segments[k], ag.segments[k]["end"] - t
+
+# ============================ 화면 (브라우저) ============================
+# 카운트다운·자동 넘김·효과음은 브라우저가 performance.now(단조 시계)로 처리. 서버는 재실행 때 경과 초만 넘겨 줌
+AGENDA_HTML = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Press+Start+2P&display=swap');
+html,body{ margin:0; background:#0f172a; }
+.crt{ position:relative; height:calc(100vh - 12px); border-radius:22px; overflow:hidden; border:4px solid #22d3ee;
+      box-shadow:0 0 0 6px #0b1220,0 0 28px rgba(34,211,238,.25), inset 0 0 60px rgba(0,0,0,.6); }
+.crt:after{ content:""; position:absolute; inset:0; pointer-events:none; opacity:.6; mix-blend-mode:overlay;
+  background:repeating-linear-gradient(0deg, rgba(255,255,255,.035) 0px, rgba(255,255,255,.035) 1px, transparent 2px, transparent 3px); }
+.screen{ position:absolute; inset:0; display:flex; flex-direction:column; align-items:center; justify-content:center; gap:22px;
+         font-family:'Press Start 2P', monospace; text-align:center; color:#fff; background:#16a34a; }
+.who{ font-size:clamp(14px,3.5vw,36px); }
+.time{ font-size:clamp(48px,14vw,150px); font-weight:900; letter-spacing:.04em; text-shadow:0 0 18px rgba(34,211,238,.18); }
+.urgent{ animation: blink 1s infinite; } @keyframes blink{ 0%{opacity:1} 50%{opacity:.65} 100%{opacity:1} }
+.sub{ font-size:clamp(10px,2vw,20px); color:rgba(255,255,255,.92); }
+</style>
+<div class="crt"><div class="screen" id="scr">
+  <div class="who" id="who"></div><div class="time" id="time"></div><div class="sub" id="sub"></div>
+</div></div>
+<audio id="sfx" src="__SOUND__"></audio>
+<script>
+const A = __STATE__;
+const t0 = performance.now();
+const scr = document.getElementById("scr"), who = document.getElementById("who"),
+      tm = document.getElementById("time"), sub = document.getElementById("sub"), sfx = document.getElementById("sfx");
+const ends = A.segments.map(s => s.end);
+const talks = A.segments.filter(s => s.kind === "talk").length;
+let last = -1;
+const fmt = s => { s = Math.max(0, Math.round(s)); return String(Math.floor(s/60)).padStart(2,"0") + ":" + String(s%60).padStart(2,"0"); };
+function tick(){
+  const el = A.running && !A.paused ? Math.min(A.total, A.elapsed + (performance.now() - t0) / 1000) : A.elapsed;
+  let k = 0; while (k < ends.length && ends[k] <= el) k++;
+  if (k !== last && last !== -1 && A.sound && A.running && !A.paused) { sfx.currentTime = 0; sfx.play().catch(() => {}); }
+  last = k;
+  if (k >= A.segments.length){ who.textContent = "THE END"; tm.textContent = "00:00"; tm.className = "time";
+    sub.textContent = "완료!"; scr.style.background = "#16a34a"; return; }
+  const seg = A.segments[k], rem = seg.end - el, ratio = rem / (seg.end - seg.start);
+  const n = A.segments.slice(0, k + 1).filter(s => s.kind === "talk").length + (seg.kind === "gap" ? 1 : 0);
+  who.textContent = seg.kind === "talk" ? seg.name : "다음: " + seg.name;
+  tm.textContent = fmt(rem);
+  tm.className = "time" + (A.running && !A.paused && seg.kind === "talk" && rem <= 10 ? " urgent" : "");
+  const state = !A.running ? "대기 중" : (A.paused ? "일시정지" : (seg.kind === "talk" ? "발표 중" : "교대 중"));
+  sub.textContent = state + " · " + n + "/" + talks;
+  scr.style.background = seg.kind === "gap" ? "#0e7490" : (!A.running || ratio > .5 ? "#16a34a" : (ratio > .2 ? "#f59e0b" : "#dc2626"));
+}
+tick(); setInterval(tick, 100);
+</script>
+"""
+
+def agenda_state(ag: Agenda, sound: bool = False, now: Optional[float] = None) -> Dict:
+    """화면 스크립트에 넘길 상태 (경과 초는 지금 서버 시계 기준)"""
+    return {"segments": ag.segments, "total": ag.total, "elapsed": elapsed(ag, now),
+            "running": ag.started_at is not None, "paused": ag.paused_at is not None, "sound": sound}
+
+def agenda_html(ag: Agenda, sound_uri: str = "", now: Optional[float] = None) -> str:
+    state = agenda_state(ag, bool(sound_uri), now)
+    # 이름에 '</script>'가 있어도 <script>가 닫히지 않도록 '</'를 '<\/'로 (JSON 문자열 값은 같음)
+    # 이름 속 '__SOUND__'가 바뀌지 않도록 발표자 상태는 맨 마지막에 넣음
+    data = json.dumps(state, ensure_ascii=False).replace("</", "<\\/")
+    return AGENDA_HTML.replace("__SOUND__", sound_uri).replace("__STATE__", data)
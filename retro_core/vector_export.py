@@ -0,0 +1,179 @@
+# retro_core/vector_export.py
+# 좌석표 벡터 내보내기 (SVG / PDF)
+# - render_png와 같은 좌석 데이터·같은 배치(칸 240×130, 여백 24)를 도형/글자로 출력 → 어떤 크기로 인쇄해도 선명
+# - 폰트는 명단에 쓰인 글자만 남기도록 서브셋해서 파일 안에 넣음 (fontTools 필요: pip install fonttools)
+import base64, io, zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from retro_core.fonts import font_data, resolve
+from retro_core.seating import Grid, fill_color
+
+NAME_SIZE, BADGE_SIZE = 22, 16
+BG, OUTLINE, TEXT = (15,23,42), (56,189,248), (226,232,240)
+BADGE_BG, BADGE_LINE = (2,6,23), (148,163,184)
+PX_TO_PT = 0.75   # 96dpi 기준 1px = 0.75pt
+
+def chart_items(seats: Grid, cell=(240,130), margin=24) -> Tuple[int, int, List[Dict]]:
+    """좌석표를 도형 목록으로: (너비, 높이, [{"kind": "rect"|"text", ...}])"""
+    rows, cols = len(seats), len(seats[0]) if seats else 0
+    cw, ch = cell
+    w, h = cols*cw + margin*2, rows*ch + margin*2
+    items = []
+    for i in range(rows):
+        for j in range(cols):
+            x0, y0 = margin + j*cw, margin + i*ch
+            person = seats[i][j] or {}
+            name, gender, group = person.get("name", ""), person.get("gender"), person.get("group")
+            items.append({"kind": "rect", "x": x0+1.5, "y": y0+1.5, "w": cw-4, "h": ch-4, "r": 18,
+                          "fill": fill_color(gender), "stroke": OUTLINE, "sw": 3})
+            if group:
+                items.append({"kind": "rect", "x": x0+10.5, "y": y0+8.5, "w": 42, "h": 24, "r": 8,
+                              "fill": BADGE_BG, "stroke": BADGE_LINE, "sw": 1})
+                items.append({"kind": "text", "x": x0+20, "y": y0+8+12+BADGE_SIZE*0.35, "size": BADGE_SIZE, "text": str(group)})
+            if name:
+                items.append({"kind": "text", "x": x0+20, "y": y0+ch/2+NAME_SIZE*0.35, "size": NAME_SIZE, "text": name})
+    return w, h, items
+
+def chart_text(items: List[Dict]) -> str:
+    return "".join(sorted({c for it in items if it["kind"] == "text" for c in it["text"]}))
+
+@lru_cache(maxsize=16)
+def subset_font(font_key: str, text: str, flavor: Optional[str] = None) -> bytes:
+    """text에 쓰인 글자만 남긴 TTF (flavor="woff"면 WOFF). 폰트는 retro_core.fonts의 키, 같은 폰트·같은 명단이면 캐시에서"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    data = font_data(font_key)
+    if data is None: raise KeyError(f"등록되지 않은 폰트입니다: {font_key}")
+    font = TTFont(io.BytesIO(data), fontNumber=0)
+    opts = subset.Options()
+    opts.name_IDs, opts.name_languages, opts.notdef_outline = ["*"], ["*"], True
+    opts.layout_features, opts.hinting = [], False
+    opts.drop_tables += ["TSI0", "TSI1", "TSI2", "TSI3", "TSI5"]   # VTT 힌팅 원본 (서브셋 불가, 표시에 불필요)
+    opts.flavor = flavor
+    sub = subset.Subsetter(opts)
+    sub.populate(text=text + " 0123456789")
+    sub.subset(font)
+    buf = io.BytesIO(); subset.save_font(font, buf, opts); return buf.getvalue()   # save_font가 flavor(WOFF 압축)를 적용
+
+def _rgb(c) -> str:
+    return "#%02x%02x%02x" % c
+
+def render_svg(seats: Grid, font_bytes: Optional[bytes] = None, cell=(240,130), margin=24, font_key: Optional[str] = None) -> bytes:
+    """SVG 좌석표. 폰트(bytes 또는 등록된 키)를 주면 명단 글자만 서브셋한 WOFF를 @font-face로 넣음"""
+    w, h, items = chart_items(seats, cell, margin)
+    face = ""
+    font_key = resolve(font_bytes, font_key)
+    if font_key:
+        woff = subset_font(font_key, chart_text(items), flavor="woff")
+        face = ("@font-face{font-family:'SeatFont';src:url(data:font/woff;base64,"
+                + base64.b64encode(woff).decode("ascii") + ") format('woff');}")
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">',
+           f"<style>{face}text{{font-family:'SeatFont','Noto Sans KR','Malgun Gothic',sans-serif;fill:{_rgb(TEXT)};}}</style>",
+           f'<rect width="{w}" height="{h}" fill="{_rgb(BG)}"/>']
+    for it in items:
+        if it["kind"] == "rect":
+            out.append(f'<rect x="{it["x"]:g}" y="{it["y"]:g}" width="{it["w"]:g}" height="{it["h"]:g}" rx="{it["r"]}" '
+                       f'fill="{_rgb(it["fill"])}" stroke="{_rgb(it["stroke"])}" stroke-width="{it["sw"]}"/>')
+        else:
+            out.append(f'<text x="{it["x"]:g}" y="{it["y"]:g}" font-size="{it["size"]}">{escape(it["text"])}</text>')
+    out.append("</svg>")
+    return "\n".join(out).encode("utf-8")
+
+# ============================ PDF ============================
+def _round_rect(x, y, w, h, r) -> str:
+    k = 0.5523 * r   # 베지어 근사 상수
+    return (f"{x+r:.2f} {y:.2f} m {x+w-r:.2f} {y:.2f} l {x+w-r+k:.2f} {y:.2f} {x+w:.2f} {y+r-k:.2f} {x+w:.2f} {y+r:.2f} c "
+            f"{x+w:.2f} {y+h-r:.2f} l {x+w:.2f} {y+h-r+k:.2f} {x+w-r+k:.2f} {y+h:.2f} {x+w-r:.2f} {y+h:.2f} c "
+            f"{x+r:.2f} {y+h:.2f} l {x+r-k:.2f} {y+h:.2f} {x:.2f} {y+h-r+k:.2f} {x:.2f} {y+h-r:.2f} c "
+            f"{x:.2f} {y+r:.2f} l {x:.2f} {y+r-k:.2f} {x+r-k:.2f} {y:.2f} {x+r:.2f} {y:.2f} c h")
+
+def _color(c, op: str) -> str:
+    return f"{c[0]/255:.3f} {c[1]/255:.3f} {c[2]/255:.3f} {op}"
+
+def render_pdf(seats: Grid, font_bytes: Optional[bytes] = None, cell=(240,130), margin=24, font_key: Optional[str] = None) -> bytes:
+    """
+    PDF 좌석표 (한 쪽). 한글 표시를 위해 폰트(TTF bytes 또는 등록된 키)가 필요합니다.
+    명단 글자만 서브셋한 TrueType을 Type0/Identity-H 폰트로 넣고, ToUnicode도 넣어 글자 복사·검색이 됩니다.
+    """
+    from fontTools.ttLib import TTFont
+    w, h, items = chart_items(seats, cell, margin)
+    font_key = resolve(font_bytes, font_key)
+    if not font_key: raise ValueError("PDF에는 한글 폰트(TTF)가 필요합니다")
+    sub_bytes = subset_font(font_key, chart_text(items))
+    font = TTFont(io.BytesIO(sub_bytes))
+    cmap = font.getBestCmap()
+    upm = font["head"].unitsPerEm
+    scale = 1000 / upm
+    hmtx = font["hmtx"]
+
+    def gid(ch):
+        name = cmap.get(ord(ch))
+        return font.getGlyphID(name) if name else 0
+
+    used: Dict[int, str] = {}
+    ops = [f"{PX_TO_PT} 0 0 {-PX_TO_PT} 0 {h*PX_TO_PT:.2f} cm",
+           _color(BG, "rg"), f"0 0 {w} {h} re f"]
+    for it in items:
+        if it["kind"] == "rect":
+            ops += [_color(it["fill"], "rg"), _color(it["stroke"], "RG"), f"{it['sw']} w",
+                    _round_rect(it["x"], it["y"], it["w"], it["h"], it["r"]), "B"]
+        else:
+            gids = [gid(c) for c in it["text"]]
+            for g, c in zip(gids, it["text"]): used.setdefault(g, c)
+            hexstr = "".join(f"{g:04X}" for g in gids)
+            ops += ["BT", _color(TEXT, "rg"), f"/F1 {it['size']} Tf",
+                    f"1 0 0 -1 {it['x']:.2f} {it['y']:.2f} Tm", f"<{hexstr}> Tj", "ET"]
+    content = zlib.compress("\n".join(ops).encode("ascii"))
+
+    widths = " ".join(f"{g} [{round(hmtx[font.getGlyphName(g)][0] * scale)}]" for g in sorted(used))
+    pairs = sorted(used.items())
+    bfchars = []
+    for k in range(0, len(pairs), 100):   # bfchar 블록 하나에 최대 100개
+        chunk = pairs[k:k+100]
+        bfchars.append(f"{len(chunk)} beginbfchar")
+        bfchars += [f"<{g:04X}> <{c.encode('utf-16-be').hex().upper()}>" for g, c in chunk]
+        bfchars.append("endbfchar")
+    tounicode = "\n".join([
+        "/CIDInit /ProcSet findresource begin 12 dict begin begincmap",
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def",
+        "/CMapName /Adobe-Identity-UCS def /CMapType 2 def",
+        "1 begincodespacerange <0000> <FFFF> endcodespacerange",
+        *bfchars,
+        "endcmap CMapName currentdict /CMap defineresource pop end end",
+    ]).encode("ascii")
+
+    head, hhea = font["head"], font["hhea"]
+    bbox = " ".join(str(round(v * scale)) for v in (head.xMin, head.yMin, head.xMax, head.yMax))
+    base = "/SEATSB+SeatFont"
+    font_file = zlib.compress(sub_bytes)
+
+    objs = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {w*PX_TO_PT:.2f} {h*PX_TO_PT:.2f}] "
+         f"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>").encode("ascii"),
+        b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content) + content + b"\nendstream",
+        f"<< /Type /Font /Subtype /Type0 /BaseFont {base} /Encoding /Identity-H /DescendantFonts [6 0 R] /ToUnicode 8 0 R >>".encode("ascii"),
+        (f"<< /Type /Font /Subtype /CIDFontType2 /BaseFont {base} "
+         f"/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> "
+         f"/FontDescriptor 7 0 R /W [{widths}] /CIDToGIDMap /Identity >>").encode("ascii"),
+        (f"<< /Type /FontDescriptor /FontName {base} /Flags 4 /FontBBox [{bbox}] /ItalicAngle 0 "
+         f"/Ascent {round(hhea.ascent*scale)} /Descent {round(hhea.descent*scale)} /CapHeight {round(hhea.ascent*scale)} "
+         f"/StemV 80 /FontFile2 9 0 R >>").encode("ascii"),
+        b"<< /Length %d >>\nstream\n" % len(tounicode) + tounicode + b"\nendstream",
+        b"<< /Length %d /Length1 %d /Filter /FlateDecode >>\nstream\n" % (len(font_file), len(sub_bytes)) + font_file + b"\nendstream",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for n, body in enumerate(objs, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % n + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1))
+    for off in offsets:
+        out.write(b"%010d 00000 n \n" % off)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref))
+    return out.getvalue()
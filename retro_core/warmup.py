@@ -0,0 +1,116 @@
+# retro_core/warmup.py
+# 서버 시작 때 캐시 미리 채우기 → 배포 직후 첫 교실이 import·파일 읽기·폰트 파싱 비용을 치르지 않도록
+#
+#   python -m retro_core.warmup streamlit_app.py [streamlit 옵션...]     # = streamlit run + 백그라운드 워밍업
+#
+# - 워밍업은 데몬 스레드에서 돌므로 포트는 바로 열림 (아직 안 채워진 캐시는 페이지가 부를 때 그 자리에서 채움)
+# - 채우는 캐시는 모두 프로세스 전역: retro_core.assets(MP3·GIF), seating.load_fonts(기본 폰트·RETRO_FONT),
+#   mbti.SCORING / praise.DEFAULT_COMPLIMENTS(모듈 상수), 페이지가 쓰는 무거운 모듈 import, KST 시간대
+# - 마지막으로 포트가 열리면 모든 페이지를 한 번씩 실행 → Streamlit의 첫 실행 비용(지연 import, 페이지 스크립트
+#   컴파일, CSS·HTML 블록 처리)까지 첫 교실 대신 치름
+# - RETRO_WARMUP=0 이면 끔 (첫 요청 지연 비교용)
+import importlib, logging, os, sys, threading, time
+from typing import Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+REPORT: Dict[str, float] = {}      # 단계 → 걸린 초 (실패한 단계는 -1, 원인은 로그로)
+PRIME_TIMEOUT = 60                 # 페이지 미리 실행: 서버가 열리기를 기다릴 최대 초
+_started = False
+_lock = threading.Lock()
+
+def _imports():
+    for mod in ("pandas", "numpy", "PIL.Image", "PIL.ImageDraw", "PIL.ImageFont",
+                "retro_core.mbti", "retro_core.praise", "retro_core.roulette", "retro_core.timer",
+                "retro_core.seating", "retro_core.seat_rules", "retro_core.exam_hall", "retro_core.vector_export",
+                "retro_core.actions", "retro_core.store"):
+        importlib.import_module(mod)
+
+def _optional_imports():
+    try: importlib.import_module("fontTools.subset")   # SVG/PDF 내보내기 (없어도 됨)
+    except ImportError: pass
+
+def _assets():
+    from retro_core import assets
+    assets.asset_bytes(assets.ROULETTE_GIF)
+    assets.data_uri(assets.SUCCESS_SOUND)
+    assets.sfx_data_uris()
+
+def _fonts():
+    from retro_core.fonts import default_font
+    from retro_core.seating import load_fonts
+    load_fonts(None)
+    if default_font(): load_fonts(default_font())     # RETRO_FONT 서버 기본 폰트
+
+def _timezone():
+    from zoneinfo import ZoneInfo
+    ZoneInfo("Asia/Seoul")
+
+def _pages():
+    """서버가 뜨면 페이지마다 세션 하나로 한 번씩 실행 (Streamlit 내부의 첫 실행 비용: 지연 import·스크립트 컴파일 등)"""
+    import asyncio, urllib.request
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from retro_core.stclient import PAGES, WebSocket, run_script
+    deadline = time.monotonic() + PRIME_TIMEOUT
+    while not Runtime.exists():          # 명령줄 옵션(포트 등)은 런타임이 만들어질 때 이미 반영돼 있음
+        if time.monotonic() > deadline: raise TimeoutError("Streamlit 런타임이 시작되지 않았습니다")
+        time.sleep(0.1)
+    host = config.get_option("server.address") or "127.0.0.1"
+    if host in ("0.0.0.0", "::"): host = "127.0.0.1"
+    port = int(config.get_option("server.port"))
+    base = config.get_option("server.baseUrlPath").strip("/")
+    base = f"/{base}" if base else ""
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}{base}/_stcore/health", timeout=1) as r:
+                if r.status == 200: break
+        except OSError:
+            pass
+        if time.monotonic() > deadline: raise TimeoutError("서버가 열리지 않았습니다")
+        time.sleep(0.2)
+
+    async def prime():
+        for page in PAGES:
+            ws = await WebSocket.connect(host, port, f"{base}/_stcore/stream")
+            try: await run_script(ws, page)
+            finally: ws.close()
+    asyncio.run(prime())
+
+STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("imports", _imports), ("fonttools", _optional_imports), ("assets", _assets),
+    ("fonts", _fonts), ("timezone", _timezone), ("pages", _pages),
+]
+
+def warm_up() -> Dict[str, float]:
+    """모든 단계를 차례로 실행 (한 단계가 실패해도 나머지는 계속)"""
+    for name, step in STEPS:
+        t = time.perf_counter()
+        try:
+            step(); REPORT[name] = time.perf_counter() - t
+        except Exception:
+            REPORT[name] = -1.0
+            log.exception("워밍업 단계 '%s' 실패 (서버는 계속 동작, 이 캐시는 첫 요청 때 채워짐)", name)
+    return REPORT
+
+def start() -> Optional[threading.Thread]:
+    """프로세스에서 한 번만 워밍업 스레드를 띄움 (이미 떴거나 RETRO_WARMUP=0 이면 None)"""
+    global _started
+    if os.environ.get("RETRO_WARMUP", "1") == "0": return None
+    with _lock:
+        if _started: return None
+        _started = True
+    th = threading.Thread(target=warm_up, name="retro-warmup", daemon=True)
+    th.start()
+    return th
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """워밍업을 시작하고 같은 프로세스에서 streamlit run (캐시를 페이지와 공유해야 하므로 별도 프로세스 X)"""
+    start()
+    from streamlit.web import cli as stcli
+    sys.argv = ["streamlit", "run", *(sys.argv[1:] if argv is None else argv)]
+    return stcli.main()
+
+if __name__ == "__main__":
+    # python -m 으로 실행하면 이 파일은 __main__ 이 되므로, 페이지가 import하는 retro_core.warmup 쪽 상태를 쓰도록 위임
+    from retro_core.warmup import main as _main
+    raise SystemExit(_main())
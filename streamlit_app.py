@@ -1,4 +1,9 @@
 import streamlit as st
+from retro_core import warmup
+
+# `python -m retro_core.warmup`으로 띄우면 서버 시작 때 이미 돌고 있음 (그때는 아무 일 없음)
+# `streamlit run`만 쓰면 누군가 홈을 처음 열 때 여기서 시작 → 첫 교실은 워밍업 비용을 그대로 치름
+warmup.start()
 
 st.set_page_config(page_title="Retro Class Tools", page_icon="🕹️")
 
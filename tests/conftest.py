@@ -0,0 +1,12 @@
+# tests/conftest.py
+# 테스트마다 빈 저장소(RETRO_STORE)를 써서 홈 폴더의 실제 저장소를 건드리지 않음
+import pytest
+
+from retro_core import fonts
+
+@pytest.fixture(autouse=True)
+def temp_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("RETRO_STORE", str(tmp_path / "store.sqlite3"))
+    fonts._store.cache_clear()
+    yield
+    fonts._store.cache_clear()
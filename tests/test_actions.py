@@ -0,0 +1,107 @@
+# tests/test_actions.py
+# ActionGate: 연타(두 번·세 번 눌림), hold() 중 클릭, 칸별 토큰, 무작위 연타 재생 → 창(window) 불변식과 통계
+import random
+
+import pytest
+
+from retro_core.actions import DEFAULT_WINDOW, ActionGate, allow, gate_for, guarded
+
+def replay(gate, trace):
+    """trace = [(시각, 동작, 토큰)] → 허용 여부 목록"""
+    return [gate.allow(action, token, now=t) for t, action, token in trace]
+
+# ============================ 연타 ============================
+def test_double_tap_runs_once():
+    gate = ActionGate()
+    assert replay(gate, [(10.0, "draw", None), (10.2, "draw", None)]) == [True, False]
+    assert gate.stats() == {"draw": (1, 1)}
+
+def test_triple_tap_runs_once():
+    gate = ActionGate()
+    assert replay(gate, [(0.0, "spin", None), (0.15, "spin", None), (0.3, "spin", None)]) == [True, False, False]
+    assert gate.accepted["spin"] == 1 and gate.suppressed["spin"] == 2
+    assert gate.total_suppressed == 2
+
+def test_window_is_measured_from_last_accepted_click():
+    # 무시된 클릭은 창을 늘리지 않음 → 0.5초 간격 연타는 한 번 걸러 한 번씩 실행
+    gate = ActionGate(window=0.6)
+    assert replay(gate, [(k * 0.5, "draw", None) for k in range(5)]) == [True, False, True, False, True]
+
+def test_click_after_window_runs_again():
+    gate = ActionGate()
+    assert replay(gate, [(0.0, "draw", None), (DEFAULT_WINDOW, "draw", None)]) == [True, True]
+
+def test_actions_do_not_block_each_other():
+    gate = ActionGate()
+    assert replay(gate, [(0.0, "start", None), (0.1, "toggle", None), (0.2, "skip", None)]) == [True, True, True]
+
+# ============================ 칸(토큰) ============================
+def test_same_cell_is_debounced_different_cells_are_not():
+    gate = ActionGate()
+    trace = [(0.0, "seat", (0, 0)), (0.1, "seat", (0, 0)), (0.2, "seat", (1, 2)), (0.3, "seat", (1, 2))]
+    assert replay(gate, trace) == [True, False, True, False]
+    assert gate.stats() == {"seat": (2, 2)}
+
+# ============================ hold() ============================
+def test_clicks_during_hold_are_absorbed():
+    gate = ActionGate()
+    assert gate.allow("spin", now=0.0)
+    gate.hold("spin", 2.5, now=0.0)
+    assert replay(gate, [(1.0, "spin", None), (2.0, "spin", None), (2.49, "spin", None)]) == [False] * 3
+    assert gate.allow("spin", now=2.5)
+    assert gate.stats() == {"spin": (2, 3)}
+
+def test_hold_covers_every_token_and_only_extends():
+    gate = ActionGate()
+    gate.hold("seat", 3.0, now=0.0)
+    gate.hold("seat", 1.0, now=0.5)       # 짧은 hold가 긴 hold를 줄이지 않음
+    assert not gate.allow("seat", (4, 4), now=2.0)
+    assert gate.allow("seat", (4, 4), now=3.0)
+
+def test_release_ends_hold_early():
+    gate = ActionGate()
+    gate.hold("draw", 10.0, now=0.0)
+    assert not gate.allow("draw", now=1.0)
+    gate.release("draw")
+    assert gate.allow("draw", now=1.1)
+
+# ============================ 무작위 연타 ============================
+@pytest.mark.parametrize("seed", range(20))
+def test_random_bursts_keep_window_invariant(seed):
+    rng = random.Random(seed)
+    window = rng.choice([0.3, 0.6, 1.0])
+    gate = ActionGate(window=window)
+    t, trace = 0.0, []
+    for _ in range(200):
+        t += rng.expovariate(1 / 0.4)
+        trace.append((t, rng.choice(["draw", "spin"]), rng.choice([None, (0, 0), (0, 1)])))
+    ok = replay(gate, trace)
+
+    last = {}
+    for (t, action, token), accepted in zip(trace, ok):
+        key = (action, token)
+        if accepted:
+            assert key not in last or t - last[key] >= window
+            last[key] = t
+        else:
+            assert key in last and t - last[key] < window
+    for action in ("draw", "spin"):
+        clicks = [a for (_, a, _), _ok in zip(trace, ok) if a == action]
+        accepted = sum(1 for (_, a, _), _ok in zip(trace, ok) if a == action and _ok)
+        assert gate.accepted[action] == accepted
+        assert gate.suppressed[action] == len(clicks) - accepted
+    assert gate.total_suppressed == ok.count(False)
+
+# ============================ 세션 도우미 ============================
+def test_gate_lives_in_session_state():
+    state = {}
+    assert gate_for(state) is gate_for(state)
+    assert allow(state, "shuffle") and not allow(state, "shuffle")
+    assert gate_for(state).stats() == {"shuffle": (1, 1)}
+
+def test_guarded_callback_runs_once_per_burst():
+    state, calls = {}, []
+    cb = guarded(state, "lock", calls.append, token=(2, 3))
+    cb("a"); cb("b"); cb("c")
+    assert calls == ["a"]
+    assert gate_for(state).suppressed["lock"] == 2
@@ -0,0 +1,69 @@
+# tests/test_exam_hall.py
+# allocate_exam_hall: 돌려주는 conflicts = 실제로 같은 반끼리 좌우·앞뒤로 붙은 쌍의 수
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from retro_core.exam_hall import allocate_exam_hall, parse_rooms
+
+def adjacent_pairs(plan: pd.DataFrame) -> int:
+    n = 0
+    for _, g in plan.groupby("room"):
+        seat = {(r, c): h for r, c, h in zip(g["row"], g["col"], g["homeroom"])}
+        for (r, c), h in seat.items():
+            n += (seat.get((r, c + 1)) == h) + (seat.get((r + 1, c)) == h)
+    return n
+
+def random_school(rng):
+    classes = rng.randint(1, 5)
+    students = pd.DataFrame([(f"s{k}", f"{rng.randint(1, classes)}반") for k in range(rng.randint(5, 80))],
+                            columns=["name", "homeroom"])
+    rooms = []
+    for k in range(rng.randint(1, 3)):
+        r, c = rng.randint(1, 6), rng.randint(1, 7)
+        rooms.append({"name": f"R{k}", "blocked": np.array([[rng.random() < 0.1 for _ in range(c)] for _ in range(r)])})
+    return students, rooms
+
+@pytest.mark.parametrize("seed", range(200))
+def test_conflicts_count_adjacent_same_homeroom_pairs(seed):
+    rng = random.Random(seed)
+    students, rooms = random_school(rng)
+    plan, conflicts, left = allocate_exam_hall(students, rooms, seed=seed)
+    assert conflicts == adjacent_pairs(plan)
+    assert len(plan) + left == len(students)
+    assert plan["name"].is_unique
+
+def test_two_homerooms_in_checkerboard_have_no_conflicts():
+    students = pd.DataFrame([(f"a{k}", "1반") for k in range(8)] + [(f"b{k}", "2반") for k in range(8)],
+                            columns=["name", "homeroom"])
+    plan, conflicts, left = allocate_exam_hall(students, parse_rooms("A, 4, 4"), seed=1)
+    assert (conflicts, left) == (0, 0)
+
+def test_single_homeroom_fills_with_every_pair_counted():
+    students = pd.DataFrame([(f"s{k}", "1반") for k in range(6)], columns=["name", "homeroom"])
+    plan, conflicts, _ = allocate_exam_hall(students, parse_rooms("A, 2, 3"), seed=0)
+    assert conflicts == 7       # 가로 2×2 + 세로 3
+
+def school(counts):
+    return pd.DataFrame([(f"{h}-{k}", h) for h, n in counts.items() for k in range(n)], columns=["name", "homeroom"])
+
+def test_spare_seats_are_left_empty_instead_of_conflicts():
+    plan, conflicts, left = allocate_exam_hall(school({"1반": 20, "2반": 4}), parse_rooms("A,5,4\nB,5,4"), seed=0)
+    assert (conflicts, left) == (0, 0)
+    assert plan["room"].value_counts().to_dict() == {"A": 12, "B": 12}
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rooms_are_balanced_by_usable_seats(seed):
+    rooms = parse_rooms("\n".join(f"R{k:02d},6,6" for k in range(36)))
+    plan, conflicts, left = allocate_exam_hall(school({f"{k+1}반": 120 for k in range(10)}), rooms, seed=seed)
+    sizes = plan["room"].value_counts()
+    assert (conflicts, left) == (0, 0)
+    assert len(sizes) == 36 and sizes.max() - sizes.min() <= 1
+
+def test_quota_follows_usable_seats():
+    rooms = parse_rooms("A,4,5,1-1 1-2 1-3 1-4 1-5\nB,4,5")   # A 15석, B 20석
+    plan, _, left = allocate_exam_hall(school({"1반": 14, "2반": 14}), rooms, seed=3)
+    assert left == 0
+    assert plan["room"].value_counts().to_dict() == {"A": 12, "B": 16}
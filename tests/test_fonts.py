@@ -0,0 +1,52 @@
+# tests/test_fonts.py
+# fonts: 내용 해시 키, 최근 사용 순 보관(MAX_FONTS), 공유 저장소를 통한 worker 간 공유, 서버 기본 폰트
+import pytest
+
+from retro_core import fonts
+
+@pytest.fixture(autouse=True)
+def fresh_worker():
+    """이 프로세스 메모리를 비움 = 새 worker"""
+    fonts._uploaded.clear()
+    yield
+    fonts._uploaded.clear()
+
+def test_font_uploaded_on_one_worker_is_usable_on_another():
+    key = fonts.register_font(b"font-bytes-a", "나눔고딕.ttf")
+    fonts._uploaded.clear()                       # 다른 worker: 메모리에 없음
+    assert (key, "나눔고딕.ttf") in fonts.registered()
+    assert fonts.font_data(key) == b"font-bytes-a"
+    assert key in fonts._uploaded                 # 한 번 읽으면 이 worker 메모리에도
+
+def test_unknown_key_is_none():
+    assert fonts.font_data("0" * 32) is None and fonts.font_data(None) is None
+
+def test_least_recently_used_font_is_dropped_after_max_fonts():
+    keys = [fonts.register_font(f"font-{k}".encode(), f"f{k}.ttf") for k in range(fonts.MAX_FONTS)]
+    fonts.font_data(keys[0])                      # 0번을 최근에 씀 → 다음에 버릴 것은 1번
+    extra = fonts.register_font(b"font-extra", "extra.ttf")
+    assert list(fonts._uploaded) == [keys[2], keys[3], keys[0], extra]
+    assert fonts.font_data(keys[0]) == b"font-0"
+
+def test_store_keeps_only_max_fonts():
+    keys = [fonts.register_font(f"font-{k}".encode(), f"f{k}.ttf") for k in range(fonts.MAX_FONTS + 1)]
+    fonts._uploaded.clear()
+    assert fonts.font_data(keys[0]) is None
+    assert [k for k, _ in fonts.registered()] == keys[:0:-1]
+
+def test_same_bytes_same_key():
+    a = fonts.register_font(b"same", "a.ttf")
+    assert fonts.register_font(b"same", "b.ttf") == a == fonts.font_key(b"same")
+    assert len(fonts._uploaded) == 1
+
+def test_default_font_is_pinned(tmp_path, monkeypatch):
+    path = tmp_path / "기본.ttf"; path.write_bytes(b"default-font")
+    monkeypatch.setenv("RETRO_FONT", str(path))
+    fonts.default_font.cache_clear()
+    try:
+        key = fonts.default_font()
+        for k in range(fonts.MAX_FONTS + 1): fonts.register_font(f"font-{k}".encode())
+        assert fonts.font_data(key) == b"default-font"
+        assert fonts.registered()[0] == (key, "기본.ttf")
+    finally:
+        fonts._pinned.clear(); fonts.default_font.cache_clear()
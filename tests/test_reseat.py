@@ -0,0 +1,123 @@
+# tests/test_reseat.py
+# seating.reseat: 전입·전출을 여러 번 반복해도 남은 학생은 제자리, 중복·잠금 침범 없음, 격자는 한 번만 훑음
+import random
+
+from retro_core.seating import empty_grid, is_real, reseat, shuffle_seats
+
+def person(name, gender=None, group=None):
+    return {"name": name, "gender": gender, "group": group}
+
+def positions(seats):
+    return {p["name"]: (i, j) for i, row in enumerate(seats) for j, p in enumerate(row) if is_real(p)}
+
+def seated_names(seats):
+    return [p["name"] for row in seats for p in row if is_real(p)]
+
+def random_class(rng, rows, cols, lock_rate=0.15):
+    seats, locked = empty_grid(rows, cols), empty_grid(rows, cols, False)
+    people = [person(f"s{k}") for k in range(rng.randint(0, rows * cols))]
+    shuffle_seats(seats, locked, people, seed=rng.random())
+    for i in range(rows):
+        for j in range(cols):
+            locked[i][j] = rng.random() < lock_rate
+    return seats, locked, people
+
+# ============================ 무작위 반복 ============================
+def test_random_add_remove_sequences():
+    rng = random.Random(2025)
+    fresh = 10_000
+    for _ in range(300):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 9)
+        seats, locked, people = random_class(rng, rows, cols)
+        for _ in range(20):
+            before = positions(seats)
+            locked_before = {(i, j): seats[i][j] for i in range(rows) for j in range(cols) if locked[i][j]}
+            leaving = set(rng.sample([p["name"] for p in people], rng.randint(0, min(3, len(people)))))
+            newcomers = [person(f"s{fresh + k}") for k in range(rng.randint(0, 3))]
+            fresh += len(newcomers)
+            people = [p for p in people if p["name"] not in leaving] + newcomers
+            compact = rng.random() < 0.3
+
+            rep = reseat(seats, locked, people, seed=rng.random(), compact=compact)
+            after = positions(seats)
+            names = seated_names(seats)
+
+            assert len(names) == len(set(names)), "같은 학생이 두 자리에"
+            assert set(names) == {p["name"] for p in people} - set(rep["unseated"])
+            assert sorted(rep["removed"]) == sorted(n for n in before if n in leaving)
+            assert rep["kept"] == len([n for n in before if n not in leaving])
+            stayers = [n for n in before if n not in leaving]
+            moved = [n for n in stayers if after[n] != before[n]]
+            assert len(moved) == rep["moved"]
+            if not compact: assert not moved, "compact 없이 남은 학생이 움직임"
+            for (i, j), p in locked_before.items():
+                if is_real(p) and p["name"] not in leaving:
+                    assert seats[i][j]["name"] == p["name"], "잠긴 자리 학생이 바뀜"
+                else:
+                    assert not is_real(seats[i][j]), "잠긴 빈자리에 학생이 앉음"
+            if rep["unseated"]:
+                assert all(is_real(seats[i][j]) or locked[i][j] for i in range(rows) for j in range(cols))
+            assert not rep["duplicates"]
+
+def test_newcomers_fill_front_seats_reproducibly():
+    seats, locked = empty_grid(2, 3), empty_grid(2, 3, False)
+    seats[1][2] = person("가")
+    locked[0][0] = True
+    people = [person("가"), person("나"), person("다")]
+    a = reseat([row[:] for row in seats], locked, people, seed="1학기")
+    b_seats = [row[:] for row in seats]
+    b = reseat(b_seats, locked, people, seed="1학기")
+    assert a == b
+    assert not is_real(b_seats[0][0])
+    assert {b_seats[0][1]["name"], b_seats[0][2]["name"]} == {"나", "다"}
+    assert b_seats[1][2]["name"] == "가" and b["moved"] == 0
+
+# ============================ 동명이인 ============================
+def test_same_name_students_are_not_merged():
+    seats, locked = empty_grid(2, 2), empty_grid(2, 2, False)
+    seats[0][0], seats[1][1] = person("김민준", "M", 1), person("김민준", "M", 2)
+    people = [person("김민준", "M", 1), person("김민준", "M", 2), person("이서연", "F", 1)]
+    rep = reseat(seats, locked, people, seed=1)
+    assert rep["kept"] == 2 and rep["removed"] == [] and rep["added"] == ["이서연"]
+    assert rep["duplicates"] == ["김민준"]
+    assert seats[0][0]["group"] == 1 and seats[1][1]["group"] == 2
+    assert seated_names(seats).count("김민준") == 2
+
+def test_one_of_two_same_name_students_leaves():
+    seats, locked = empty_grid(2, 2), empty_grid(2, 2, False)
+    seats[0][0], seats[1][1] = person("김민준"), person("김민준")
+    rep = reseat(seats, locked, [person("김민준")], seed=1)
+    assert rep["removed"] == ["김민준"] and rep["kept"] == 1
+    assert rep["duplicates"] == ["김민준"]
+    assert seated_names(seats) == ["김민준"]
+
+def test_duplicate_newcomer_is_seated_not_dropped():
+    seats, locked = empty_grid(1, 3), empty_grid(1, 3, False)
+    seats[0][0] = person("박지호")
+    rep = reseat(seats, locked, [person("박지호"), person("박지호")], seed=1)
+    assert rep["added"] == ["박지호"] and rep["unseated"] == []
+    assert seated_names(seats).count("박지호") == 2
+
+# ============================ 비용 ============================
+class CountingRow(list):
+    """칸 읽기·쓰기 횟수를 세는 행 (시간 대신 결정적인 작업량으로 비용을 봄)"""
+    touched = 0
+    def __getitem__(self, k):
+        CountingRow.touched += 1; return super().__getitem__(k)
+    def __setitem__(self, k, v):
+        CountingRow.touched += 1; super().__setitem__(k, v)
+
+def touched_cells(n, changes):
+    seats, locked = empty_grid(n, n), empty_grid(n, n, False)
+    people = [person(f"s{k}") for k in range(n * n - 20)]
+    shuffle_seats(seats, locked, people, seed=0)
+    new = people[changes:] + [person(f"new{k}") for k in range(changes)]
+    grid = [CountingRow(row) for row in seats]
+    CountingRow.touched = 0
+    reseat(grid, locked, new, seed=0)
+    return CountingRow.touched
+
+def test_cost_is_one_scan_plus_changes():
+    # 칸마다 읽기 2번(학생인지, 이름) + 남은 학생 정보 갱신 1번, 바뀐 인원마다 몇 번 — 격자 × 명단 반복이 없음
+    for n, changes in [(10, 0), (50, 10), (100, 10), (100, 400)]:
+        assert touched_cells(n, changes) <= 3 * n * n + 3 * changes
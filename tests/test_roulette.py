@@ -0,0 +1,34 @@
+# tests/test_roulette.py
+# parse_team_csv: 영어·한글 헤더, 헤더 없음, 잘못된 파일은 ValueError
+import io
+
+import pytest
+
+from retro_core.roulette import parse_team_csv
+
+def parse(text: str):
+    return parse_team_csv(io.BytesIO(text.encode("utf-8")))
+
+@pytest.mark.parametrize("header", ["name,group", "Name,Team", "이름,조", "학생,팀", "성명,모둠"])
+def test_header_names(header):
+    df = parse(f"{header}\n가,1\n나,2\n")
+    assert df["학생"].tolist() == ["가", "나"]
+    assert df["팀"].tolist() == [1, 2]
+
+def test_columns_found_by_header_in_any_order():
+    df = parse("번호,조,이름\n1,A,가\n2,B,나\n")
+    assert list(zip(df["학생"], df["팀"])) == [("가", "A"), ("나", "B")]
+
+def test_headerless_uses_first_two_columns():
+    df = parse("가,1\n나,2\n다,1\n")
+    assert df["학생"].tolist() == ["가", "나", "다"]
+    assert df["팀"].tolist() == [1, 2, 1]
+
+def test_blank_rows_are_dropped():
+    df = parse("이름,조\n가,1\n,2\n나,\n")
+    assert df["학생"].tolist() == ["가"]
+
+@pytest.mark.parametrize("text", ["가\n나\n", "이름\n가\n나\n", "조\n1\n2\n", "이름,번호\n가,1\n"])
+def test_missing_team_column_raises(text):
+    with pytest.raises(ValueError):
+        parse(text)
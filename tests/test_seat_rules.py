@@ -0,0 +1,31 @@
+# tests/test_seat_rules.py
+# ConflictTracker: 교환마다 바뀐 칸만 다시 본 결과 = 처음부터 전체 점검한 결과
+import pytest
+
+from retro_core.bench_rules import bench
+from retro_core.seat_rules import ConflictTracker, pair_reasons
+from retro_core.seating import EMPTY_SEAT
+
+@pytest.mark.parametrize("n", [1, 2, 5, 12])
+def test_incremental_matches_rebuild(n):
+    assert bench(n, 500, seed=n)["match"]
+
+def test_empty_seats_never_conflict():
+    p = {"name": "가", "gender": "M", "group": 1}
+    assert pair_reasons(p, dict(EMPTY_SEAT), True, set(), {"group", "gender"}) == ()
+    assert pair_reasons(p, None, True, set(), {"group", "gender"}) == ()
+    assert pair_reasons(p, {"name": "나", "gender": "M", "group": 1}, True, set(), {"group", "gender"}) == ("group", "gender")
+
+def test_gender_rule_only_for_desk_mates():
+    seats = [[{"name": "가", "gender": "F", "group": None}], [{"name": "나", "gender": "F", "group": None}]]
+    assert ConflictTracker(2, 1).rebuild(seats).count == 0
+    seats = [[{"name": "가", "gender": "F", "group": None}, {"name": "나", "gender": "F", "group": None}]]
+    assert ConflictTracker(1, 2).rebuild(seats).edges == {((0, 0), (0, 1)): ("gender",)}
+
+def test_apart_pair_after_swap():
+    seats = [[{"name": f"{i}{j}", "gender": None, "group": None} for j in range(3)] for i in range(3)]
+    t = ConflictTracker(3, 3, {frozenset(("00", "22"))}).rebuild(seats)
+    assert t.count == 0
+    seats[0][1], seats[2][2] = seats[2][2], seats[0][1]
+    t.update(seats, [(0, 1), (2, 2)])
+    assert t.count == 1 and ((0, 0), (0, 1)) in t.edges
@@ -0,0 +1,84 @@
+# tests/test_timer.py
+# timer: Agenda 경과 초·일시정지·재개·건너뛰기·리셋 계산 (now를 넣어 시계 없이), 화면 HTML에 넣는 상태
+import json, re
+
+import pytest
+
+from retro_core import timer
+
+def agenda():
+    # 가 0~60, 교대(나) 60~70, 나 70~190
+    return timer.build_agenda([("가", 60), ("나", 120)], gap_sec=10)
+
+def test_build_agenda_inserts_gaps_between_talks():
+    ag = agenda()
+    assert [(s["name"], s["kind"], s["start"], s["end"]) for s in ag.segments] == [
+        ("가", timer.TALK, 0, 60), ("나", timer.GAP, 60, 70), ("나", timer.TALK, 70, 190)]
+    assert ag.ends == [60, 70, 190] and ag.total == 190
+    assert timer.build_agenda([("가", 60)], gap_sec=10).total == 60
+
+def test_parse_agenda_defaults_and_bad_minutes():
+    assert timer.parse_agenda("가\n나, 2\n다, 몇분\n\n라, 0\n, 3", default_min=3) == [("가", 180), ("나", 120), ("다", 180)]
+
+def test_elapsed_before_start_and_clamped_at_end():
+    ag = agenda()
+    assert timer.elapsed(ag, now=50) == 0.0
+    timer.start(ag, now=100)
+    assert timer.elapsed(ag, now=90) == 0.0
+    assert timer.elapsed(ag, now=130) == 30
+    assert timer.elapsed(ag, now=1000) == ag.total
+    assert timer.current(ag, now=1000) is None
+
+def test_pause_freezes_and_resume_shifts_schedule():
+    ag = agenda()
+    timer.start(ag, now=0)
+    timer.pause(ag, now=20)
+    assert timer.elapsed(ag, now=500) == 20
+    timer.pause(ag, now=30)                 # 이미 멈춤 → 무시
+    timer.resume(ag, now=50)
+    assert ag.shift == 30 and ag.paused_at is None
+    assert timer.elapsed(ag, now=60) == 30
+    timer.resume(ag, now=70)                # 멈추지 않았음 → 무시
+    assert ag.shift == 30
+
+def test_current_segment_and_remaining():
+    ag = agenda()
+    timer.start(ag, now=0)
+    assert timer.current(ag, now=0)[0::2] == (0, 60)
+    k, seg, left = timer.current(ag, now=60)        # 경계 = 다음 구간 시작
+    assert (k, seg["kind"], left) == (1, timer.GAP, 10)
+    k, seg, left = timer.current(ag, now=100)
+    assert (k, seg["name"], left) == (2, "나", 90)
+
+def test_skip_moves_to_next_segment_even_while_paused():
+    ag = agenda()
+    timer.start(ag, now=0)
+    timer.skip(ag, now=15)
+    assert ag.shift == -45 and timer.current(ag, now=15)[0] == 1
+    timer.pause(ag, now=20)
+    timer.skip(ag, now=40)                  # 멈춘 채로 '나' 발표 시작으로
+    k, _, left = timer.current(ag, now=99)
+    assert (k, left) == (2, 120)
+    timer.resume(ag, now=100)
+    assert timer.current(ag, now=130)[2] == pytest.approx(90)
+
+def test_reset_returns_to_not_started():
+    ag = agenda()
+    timer.start(ag, now=0); timer.skip(ag, now=5); timer.pause(ag, now=10)
+    timer.reset(ag)
+    assert (ag.started_at, ag.shift, ag.paused_at) == (None, 0.0, None)
+    assert timer.elapsed(ag, now=999) == 0.0 and len(ag.segments) == 3
+
+def test_agenda_state_reports_elapsed_and_flags():
+    ag = agenda()
+    timer.start(ag, now=0); timer.pause(ag, now=42)
+    state = timer.agenda_state(ag, now=50)
+    assert state["elapsed"] == 42 and state["running"] and state["paused"]
+
+def test_agenda_html_keeps_script_open_for_markup_in_names():
+    ag = timer.build_agenda([("</script><b>가", 60), ("__SOUND__", 60)])
+    html = timer.agenda_html(ag, sound_uri="data:audio/mp3;base64,AAAA", now=0)
+    script = html[html.index("<script>") + len("<script>"):]
+    assert script.count("</script>") == 1          # 진짜 닫는 태그 하나뿐
+    state = json.loads(re.search(r"const A = (.*);\n", script).group(1))
+    assert [s["name"] for s in state["segments"]] == ["</script><b>가", "__SOUND__"]
@@ -0,0 +1,67 @@
+# tests/test_vector_export.py
+# vector_export: SVG에 넣는 폰트는 진짜 WOFF, PDF는 열리고 ToUnicode로 명단 글자가 그대로 나옴
+import base64, io, re
+
+import pytest
+
+pytest.importorskip("fontTools")
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+from retro_core.seating import empty_grid
+from retro_core.vector_export import render_pdf, render_svg
+
+NAMES = ["김민준", "이서연", "박지호", "최<준>&"]
+CHARS = sorted(set("".join(NAMES)) | set("0123456789 "))
+
+def build_font(chars) -> bytes:
+    """chars 글자마다 네모 하나인 작은 TrueType (실제 한글 폰트 없이 서브셋·임베딩을 확인)"""
+    names = [".notdef"] + [f"uni{ord(c):04X}" for c in chars]
+    pen = TTGlyphPen(None)
+    pen.moveTo((100, 0)); pen.lineTo((100, 700)); pen.lineTo((900, 700)); pen.lineTo((900, 0)); pen.closePath()
+    box = pen.glyph()
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap({ord(c): f"uni{ord(c):04X}" for c in chars})
+    fb.setupGlyf({n: box for n in names})
+    fb.setupHorizontalMetrics({n: (1000, 100) for n in names})
+    fb.setupHorizontalHeader(ascent=880, descent=-120)
+    fb.setupNameTable({"familyName": "SeatTest", "styleName": "Regular"})
+    fb.setupOS2(); fb.setupPost()
+    buf = io.BytesIO(); fb.save(buf); return buf.getvalue()
+
+@pytest.fixture(scope="module")
+def font():
+    return build_font(CHARS)
+
+def seats():
+    grid = empty_grid(2, 2)
+    for k, name in enumerate(NAMES):
+        grid[k // 2][k % 2] = {"name": name, "gender": "M" if k % 2 else "F", "group": k + 1}
+    return grid
+
+def test_svg_embeds_woff_subset(font):
+    svg = render_svg(seats(), font_bytes=font).decode("utf-8")
+    woff = base64.b64decode(re.search(r"base64,([A-Za-z0-9+/=]+)\)", svg).group(1))
+    assert woff[:4] == b"wOFF"
+    cmap = TTFont(io.BytesIO(woff)).getBestCmap()
+    assert {ord(c) for c in "김민준이서연"} <= set(cmap)
+    assert "최&lt;준&gt;&amp;" in svg
+
+def test_svg_without_font_has_no_font_face():
+    assert b"@font-face" not in render_svg(seats())
+
+def test_pdf_text_round_trips_through_tounicode(font):
+    pypdf = pytest.importorskip("pypdf")
+    reader = pypdf.PdfReader(io.BytesIO(render_pdf(seats(), font_bytes=font)))
+    assert len(reader.pages) == 1
+    text = reader.pages[0].extract_text()
+    for name in NAMES:
+        assert name in text
+    fonts = reader.pages[0]["/Resources"]["/Font"]
+    assert fonts["/F1"]["/Subtype"] == "/Type0" and "/ToUnicode" in fonts["/F1"]
+
+def test_pdf_needs_font():
+    with pytest.raises(ValueError):
+        render_pdf(seats())